@@ -9,12 +9,23 @@ import sys
 import os
 from pathlib import Path
 
-from .commands.generate import generate_command
-from .commands.convert import convert_command
-from .commands.validate import validate_command
+# Command modules are imported on dispatch: generate pulls in python-docx and
+# every command pulls in jsonschema, which dominate CLI start-up time
 
 
-def main():
+def _positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main(argv=None):
+    """Run the CLI on argv (default: sys.argv[1:]) and return the exit status."""
     parser = argparse.ArgumentParser(
         description='CVaC: CV-as-Code - Generate professional CVs from structured data',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -22,6 +33,8 @@ def main():
 Examples:
   %(prog)s generate cv.yaml resume.docx
   %(prog)s generate cv.json resume.docx --style modern.json
+  %(prog)s generate cvs/ out/ --jobs 4
+  %(prog)s generate 'cvs/*.yaml' out/
   %(prog)s convert cv.json cv.yaml
   %(prog)s validate cv.yaml
         """
@@ -43,18 +56,29 @@ Examples:
     )
     generate_parser.add_argument(
         'input',
-        help='Input CV file (JSON or YAML format)'
+        help='Input CV file (JSON or YAML format), or a directory or quoted glob of them'
     )
     generate_parser.add_argument(
         'output',
         nargs='?',
         default='resume-generated.docx',
-        help='Output DOCX file (default: resume-generated.docx)'
+        help='Output DOCX file (default: resume-generated.docx); '
+             'for a directory or glob input, the output directory (default: beside each input)'
     )
     generate_parser.add_argument(
         '--style', '-s',
         help='Custom style configuration file (JSON or YAML)'
     )
+    generate_parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Store the DOCX without compression (larger file, quicker to write)'
+    )
+    generate_parser.add_argument(
+        '--jobs', '-j',
+        type=_positive_int,
+        help='Worker processes for directory or glob input (default: number of CPUs)'
+    )
     
     # Convert subcommand
     convert_parser = subparsers.add_parser(
@@ -75,6 +99,11 @@ Examples:
         action='store_true',
         help='Pretty print output with proper formatting'
     )
+    convert_parser.add_argument(
+        '--no-validate',
+        action='store_true',
+        help='Convert without validating against the schema'
+    )
     
     # Validate subcommand
     validate_parser = subparsers.add_parser(
@@ -92,14 +121,17 @@ Examples:
     )
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Handle commands
     if args.command == 'generate':
+        from .commands.generate import generate_command
         return generate_command(args)
     elif args.command == 'convert':
+        from .commands.convert import convert_command
         return convert_command(args)
     elif args.command == 'validate':
+        from .commands.validate import validate_command
         return validate_command(args)
     else:
         # If no command specified, show help
@@ -27,17 +27,12 @@ def convert_command(args):
         
         print(f"Loading data from {args.input}...")
         
-        # Load data (with validation)
+        # Load (validating unless --no-validate) and save in the output's format
         data_handler = DataHandler()
-        data = data_handler.load_and_validate(args.input)
+        output_format = data_handler.convert(args.input, args.output, pretty=args.pretty,
+                                             validate=not args.no_validate)
         
-        # Detect output format from extension
-        output_format = data_handler.detect_format(args.output)
-        
-        print(f"Converting to {output_format.upper()} format...")
-        
-        # Save in the new format
-        data_handler.save_data(data, args.output, format_type=output_format, pretty=args.pretty)
+        print(f"Converted to {output_format.upper()} format")
         
         print(f"✅ Successfully converted to {args.output}")
         return 0
@@ -4,11 +4,112 @@ Generate command - creates DOCX from CV data.
 
 import sys
 import os
+import glob
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from ..core.data_handler import DataHandler
 from ..core.style_loader import StyleLoader
-from ..cv_to_docx import DocxGenerator
+from ..cv_to_docx import CVData, DocxGenerator
+
+# Input extensions picked up when generating from a directory
+CV_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+
+# Style configuration of a batch worker process, set by _init_worker
+_worker_style_config = None
+
+
+def _init_worker(style_path):
+    """Load the style once per worker process.
+    
+    The converted config holds python-docx Length values, which do not survive
+    pickling (Cm(n) unpickles as Cm(n) centimetres, not n EMU), so each worker
+    loads the style file itself instead of receiving the parent's config.
+    """
+    global _worker_style_config
+    _worker_style_config = StyleLoader().load_style(style_path)
+
+
+def _generate_one(input_path, output_path, compress=True):
+    """Load, validate and render one CV file in a batch worker process."""
+    data_handler = DataHandler()
+    cv_data = data_handler.load_and_validate(input_path)
+    generator = DocxGenerator(CVData.from_validated_dict(cv_data), _worker_style_config)
+    generator.generate(output_path, compress=compress)
+    return output_path
+
+
+def _is_batch_input(input_arg):
+    """True for a directory, or a (quoted) glob pattern that is not itself a file name."""
+    if os.path.isdir(input_arg):
+        return True
+    return not os.path.exists(input_arg) and any(char in input_arg for char in '*?[')
+
+
+def _batch_outputs(inputs, output_dir):
+    """Map each input path to its .docx output path.
+    
+    Outputs go to output_dir, or beside their input when it is None.
+    
+    Raises:
+        ValueError: If two inputs would write the same output file
+    """
+    outputs = {}
+    claimed = {}
+    for path in inputs:
+        output = (output_dir or path.parent) / f"{path.stem}.docx"
+        key = os.path.normcase(os.path.abspath(output))
+        if key in claimed:
+            raise ValueError(f"{claimed[key]} and {path} would both be written to {output}")
+        claimed[key] = path
+        outputs[path] = output
+    return outputs
+
+
+def _generate_batch(args):
+    """Generate one DOCX per CV file in the args.input directory or glob, in parallel."""
+    if os.path.isdir(args.input):
+        candidates = Path(args.input).iterdir()
+    else:
+        candidates = (Path(match) for match in glob.glob(args.input))
+    inputs = sorted(path for path in candidates if path.suffix.lower() in CV_EXTENSIONS)
+    if not inputs:
+        print(f"❌ Error: No JSON or YAML files found in {args.input}")
+        return 1
+    
+    # A .docx output name only makes sense for a single file; write beside the inputs
+    output_dir = None if args.output.lower().endswith('.docx') else Path(args.output)
+    # Workers run in parallel, so same-stem inputs must not share an output file
+    try:
+        outputs = _batch_outputs(inputs, output_dir)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Load the style here too so a bad style file fails once, before any worker starts
+    if args.style:
+        print(f"Loading custom style from {args.style}...")
+    StyleLoader().load_style(args.style)
+    
+    print(f"Generating {len(inputs)} documents from {args.input}...")
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                             initargs=(args.style,)) as executor:
+        futures = {
+            executor.submit(_generate_one, str(path), str(output), not args.fast): path
+            for path, output in outputs.items()
+        }
+        for future in as_completed(futures):
+            try:
+                print(f"✅ Successfully generated {future.result()}")
+            except Exception as e:
+                failures += 1
+                print(f"❌ Error in {futures[future]}: {e}")
+    
+    return 1 if failures else 0
 
 
 def generate_command(args):
@@ -22,6 +123,9 @@ def generate_command(args):
         0 on success, 1 on error
     """
     try:
+        if _is_batch_input(args.input):
+            return _generate_batch(args)
+        
         print(f"Loading CV data from {args.input}...")
         
         # Load and validate CV data
@@ -34,17 +138,13 @@ def generate_command(args):
             print(f"Loading custom style from {args.style}...")
         style_config = style_loader.load_style(args.style)
         
-        # Create a simple object to hold the data (to match existing DocxGenerator interface)
-        class CVDataWrapper:
-            def __init__(self, data):
-                self.data = data
-        
-        cv_wrapper = CVDataWrapper(cv_data)
+        # Already validated by load_and_validate
+        cv_wrapper = CVData.from_validated_dict(cv_data)
         
         # Generate the document
         print(f"Generating document...")
         generator = DocxGenerator(cv_wrapper, style_config)
-        generator.generate(args.output)
+        generator.generate(args.output, compress=not args.fast)
         
         print(f"✅ Successfully generated {args.output}")
         return 0
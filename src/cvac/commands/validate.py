@@ -8,6 +8,7 @@ from pathlib import Path
 import jsonschema
 
 from ..core.data_handler import DataHandler
+from ..core.personal import full_name
 
 
 def validate_command(args):
@@ -35,12 +36,9 @@ def validate_command(args):
         
         # Show some basic stats about the CV
         if 'personalInfo' in data:
-            name_parts = []
-            for key in ['firstName', 'middleName', 'lastName']:
-                if key in data['personalInfo'] and data['personalInfo'][key]:
-                    name_parts.append(data['personalInfo'][key])
-            if name_parts:
-                print(f"   Name: {' '.join(name_parts)}")
+            name = full_name(data['personalInfo'])
+            if name:
+                print(f"   Name: {name}")
         
         if 'workExperience' in data:
             print(f"   Work experiences: {len(data['workExperience'])}")
@@ -2,20 +2,230 @@
 Data handler for loading and validating CV data from JSON/YAML files.
 """
 
+import codecs
 import json
-import os
+import re
+from functools import lru_cache
 from pathlib import Path
 import jsonschema
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, BinaryIO, Iterable, Iterator, Optional, Literal, Tuple, Union
 
 # Try to import yaml, but don't fail if not available
 try:
     import yaml
     YAML_AVAILABLE = True
+    # libyaml's C loader (and dumper) when PyYAML was built with it
+    _YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    _YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 except ImportError:
     yaml = None
     YAML_AVAILABLE = False
 
+# Prefer fastjsonschema's generated validators when installed
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    fastjsonschema = None
+    FASTJSONSCHEMA_AVAILABLE = False
+
+# Prefer orjson's C parser for reading JSON when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps(data: Any, pretty: bool) -> bytes:
+    """Serialize data to UTF-8 JSON, 2-space indented when pretty."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+_SCHEMA_FILENAME = 'cv.schema.json'
+# Schema location in a source checkout, resolved once at import
+_PROJECT_SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent.parent / 'schema' / _SCHEMA_FILENAME
+
+# Parsed schemas and compiled validators, keyed by (schema path, schema file mtime)
+_SCHEMA_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_VALIDATOR_CACHE: Dict[Tuple[str, int], Any] = {}
+
+
+def schema_key(path: Path) -> Tuple[str, int]:
+    """Return a cache key for the file at path that changes when the file does."""
+    return (str(path), path.stat().st_mtime_ns)
+
+
+def load_schema(schema_path) -> Dict[str, Any]:
+    """
+    Return the parsed JSON schema at schema_path.
+    
+    The file is read once and reused until it changes on disk, so repeated
+    DataHandler instances share one copy. Treat the result as read-only.
+    
+    Raises:
+        FileNotFoundError: If the schema file doesn't exist
+        json.JSONDecodeError: If the schema is not valid JSON
+    """
+    path = Path(schema_path)
+    key = schema_key(path)
+    schema = _SCHEMA_CACHE.get(key)
+    if schema is None:
+        with open(path, 'rb') as f:
+            schema = _SCHEMA_CACHE[key] = json_loads(f.read())
+    return schema
+
+
+class _FastValidator:
+    """Adapts a fastjsonschema-compiled function to the jsonschema validator interface.
+    
+    fastjsonschema only decides pass/fail. Invalid data is re-checked with
+    `reference`, a jsonschema validator, so error messages and paths are the
+    same whichever backend is installed.
+    """
+    
+    def __init__(self, schema: Dict[str, Any], reference: Any):
+        # Formats stay unchecked and defaults are not injected, matching jsonschema
+        self._validate = fastjsonschema.compile(schema, use_default=False, use_formats=False)
+        self._reference = reference
+    
+    def validate(self, instance: Any) -> None:
+        if self.is_valid(instance):
+            return
+        self._reference.validate(instance)
+    
+    def is_valid(self, instance: Any) -> bool:
+        try:
+            self._validate(instance)
+        except fastjsonschema.JsonSchemaValueException:
+            return False
+        return True
+
+
+def get_validator(schema_path, schema: Optional[Dict[str, Any]] = None):
+    """
+    Return a compiled validator for the schema at schema_path.
+    
+    The validator is built once per schema file and reused until the file
+    changes on disk. fastjsonschema is used when installed and able to compile
+    the schema; errors always come from jsonschema, so they read the same
+    either way.
+    
+    Args:
+        schema_path: Path to the JSON schema file
+        schema: Already-parsed schema; loaded from schema_path if None
+        
+    Returns:
+        An object whose validate(instance) raises jsonschema.ValidationError
+        
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    path = Path(schema_path)
+    key = schema_key(path)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        if schema is None:
+            schema = load_schema(path)
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        if FASTJSONSCHEMA_AVAILABLE:
+            try:
+                validator = _FastValidator(schema, validator)
+            except fastjsonschema.JsonSchemaDefinitionException:
+                pass  # Unsupported draft or keyword; use jsonschema alone
+        _VALIDATOR_CACHE[key] = validator
+    return validator
+
+
+_FORMAT_BY_EXTENSION = {'.json': 'json', '.yaml': 'yaml', '.yml': 'yaml'}
+# Characters a JSON document can open with, and the whitespace that may precede them
+_JSON_START = (b'{', b'[', b'"')
+_LEADING_BLANKS = b' \t\r\n'
+# Bytes read by detect_format before it decides whether the rest is needed
+_SNIFF_BYTES = 4096
+# A block mapping's first key (plain or quoted) followed by ':', or a flow mapping
+_YAML_MAPPING_START = re.compile(
+    r'(?:\{|(?:"[^"]*"|\'[^\']*\'|[^\s#:\'"{}\[\],&*!|>%@`-][^:\x00-\x08]*?):(?:[ \t]|$))'
+)
+
+
+def _strip_leading_blanks(content: bytes) -> bytes:
+    """Drop a UTF-8 byte order mark and then any leading whitespace."""
+    if content.startswith(codecs.BOM_UTF8):
+        content = content[len(codecs.BOM_UTF8):]
+    return content.lstrip(_LEADING_BLANKS)
+
+
+def _sniff_format(content: bytes) -> Optional[str]:
+    """
+    Guess 'json' or 'yaml' from file content by its first non-blank character.
+    
+    Content opening like JSON is parsed as JSON, since YAML flow style can open
+    the same way. Anything else is labelled 'yaml' only if its first line past
+    comments and document markers opens a mapping; it is not parsed.
+    
+    Returns:
+        'json', 'yaml', or None if the content is neither JSON nor a YAML mapping
+        (or PyYAML is unavailable)
+    """
+    content = _strip_leading_blanks(content)
+    if content[:1] in _JSON_START:
+        try:
+            json_loads(content)
+            return 'json'
+        except json.JSONDecodeError:
+            pass
+    if not YAML_AVAILABLE:
+        return None
+    for line in content.splitlines():
+        try:
+            line = line.decode('utf-8').strip()
+        except UnicodeDecodeError:
+            return None
+        if line in ('---', '') or line.startswith(('#', '%')):
+            continue
+        if line.startswith('--- '):
+            line = line[4:].lstrip()
+        return 'yaml' if _YAML_MAPPING_START.match(line) else None
+    return None
+
+
+@lru_cache(maxsize=8)
+def _locate_default_schema(cwd: Path) -> Path:
+    """Search for the default CV schema; memoized per working directory."""
+    schema_filename = _SCHEMA_FILENAME
+    candidates = (
+        # Strategy 1: Look relative to this file (development mode)
+        _PROJECT_SCHEMA_PATH,
+        # Strategy 2: Look in current working directory
+        cwd / 'schema' / schema_filename,
+        # Strategy 3: Look in parent directories of CWD (up to 2 levels above it)
+        cwd.parent / 'schema' / schema_filename,
+        cwd.parent.parent / 'schema' / schema_filename,
+    )
+    # One stat per candidate; is_file also skips a directory of the same name
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    
+    # If we still can't find it, raise an error with helpful message
+    raise FileNotFoundError(
+        f"Cannot find {schema_filename}. Please ensure you're running from the project directory "
+        f"or specify the schema path explicitly."
+    )
+
 
 class DataHandler:
     """Handles loading, validation, and saving of CV data in JSON/YAML formats."""
@@ -33,42 +243,17 @@ class DataHandler:
         
         self.schema_path = Path(schema_path)
         self.schema = self._load_schema()
+        # Shared with other handlers on the same schema file; built once per file version
+        self._validator = get_validator(self.schema_path, self.schema)
     
     def _find_default_schema(self) -> Path:
         """Find the default CV schema file."""
-        schema_filename = 'cv.schema.json'
-        
-        # Strategy 1: Look relative to this file (development mode)
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parent.parent.parent.parent
-        schema_path = project_root / 'schema' / schema_filename
-        if schema_path.exists():
-            return schema_path
-        
-        # Strategy 2: Look in current working directory
-        cwd_schema = Path.cwd() / 'schema' / schema_filename
-        if cwd_schema.exists():
-            return cwd_schema
-        
-        # Strategy 3: Look in parent directories of CWD
-        current = Path.cwd()
-        for _ in range(3):  # Look up to 3 levels
-            potential_schema = current / 'schema' / schema_filename
-            if potential_schema.exists():
-                return potential_schema
-            current = current.parent
-        
-        # If we still can't find it, raise an error with helpful message
-        raise FileNotFoundError(
-            f"Cannot find {schema_filename}. Please ensure you're running from the project directory "
-            f"or specify the schema path explicitly."
-        )
+        return _locate_default_schema(Path.cwd())
     
     def _load_schema(self) -> Dict[str, Any]:
         """Load JSON schema for validation."""
         try:
-            with open(self.schema_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_schema(self.schema_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Schema file not found: {self.schema_path}")
         except json.JSONDecodeError as e:
@@ -87,37 +272,37 @@ class DataHandler:
         Raises:
             ValueError: If file extension is not recognized
         """
-        path = Path(filepath)
-        ext = path.suffix.lower()
+        format_type = _FORMAT_BY_EXTENSION.get(Path(filepath).suffix.lower())
+        if format_type is not None:
+            return format_type
         
-        if ext in ['.json']:
-            return 'json'
-        elif ext in ['.yaml', '.yml']:
-            return 'yaml'
-        else:
-            # Try to detect by content
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Try JSON first
-                    try:
-                        json.loads(content)
-                        return 'json'
-                    except json.JSONDecodeError:
-                        # Try YAML
-                        if not YAML_AVAILABLE:
-                            raise ValueError("Cannot determine format and PyYAML not available")
-                        yaml.safe_load(content)
-                        return 'yaml'
-            except Exception:
-                raise ValueError(f"Cannot determine format for file: {filepath}")
-    
-    def load_data(self, filepath: str) -> Dict[str, Any]:
+        # Try to detect by content; only JSON-looking content needs more than the head
+        try:
+            with open(filepath, 'rb') as f:
+                content = f.read(_SNIFF_BYTES)
+                head = _strip_leading_blanks(content)
+                if head[:1] == b'{' and head[1:].lstrip()[:1] in (b'"', b'}'):
+                    # A JSON object's first key must be quoted; YAML flow keys rarely
+                    # are, so an object is labelled without reading or parsing all of it
+                    return 'json'
+                if head[:1] in _JSON_START:
+                    content += f.read()
+        except OSError:
+            raise ValueError(f"Cannot determine format for file: {filepath}")
+        format_type = _sniff_format(content)
+        if format_type is None:
+            raise ValueError(f"Cannot determine format for file: {filepath}")
+        return format_type
+    
+    def load_data(self, filepath: Union[str, BinaryIO],
+                  format_type: Optional[Literal['json', 'yaml']] = None) -> Dict[str, Any]:
         """
         Load data from JSON or YAML file.
         
         Args:
-            filepath: Path to the data file
+            filepath: Path to the data file, or a binary file object to read
+            format_type: 'json' or 'yaml'. If None, detected from the file
+                extension, falling back to the content
             
         Returns:
             Loaded data as dictionary
@@ -126,19 +311,30 @@ class DataHandler:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is invalid
         """
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"File not found: {filepath}")
-        
-        format_type = self.detect_format(filepath)
+        # Read the whole file in one call; both parsers accept UTF-8 bytes
+        if hasattr(filepath, 'read'):
+            raw = filepath.read()
+        else:
+            try:
+                with open(filepath, 'rb') as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {filepath}") from None
+            if format_type is None:
+                format_type = _FORMAT_BY_EXTENSION.get(Path(filepath).suffix.lower())
         
+        # Sniff the bytes already in hand rather than letting detect_format reopen the file
+        if format_type is None:
+            format_type = _sniff_format(raw)
+        if format_type is None:
+            raise ValueError(f"Cannot determine format for file: {filepath}")
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                if format_type == 'json':
-                    return json.load(f)
-                else:  # yaml
-                    if not YAML_AVAILABLE:
-                        raise ImportError("PyYAML is required for YAML file support. Install with: pip install PyYAML")
-                    return yaml.safe_load(f)
+            if format_type == 'json':
+                return json_loads(raw)
+            else:  # yaml
+                if not YAML_AVAILABLE:
+                    raise ImportError("PyYAML is required for YAML file support. Install with: pip install PyYAML")
+                return yaml.load(raw, Loader=_YamlLoader)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON file: {e}")
         except Exception as e:
@@ -157,17 +353,28 @@ class DataHandler:
         Raises:
             jsonschema.ValidationError: If validation fails
         """
-        try:
-            jsonschema.validate(instance=data, schema=self.schema)
-        except jsonschema.ValidationError:
-            raise  # Re-raise with original error message
+        self._validator.validate(data)
+    
+    def is_valid(self, data: Dict[str, Any]) -> bool:
+        """
+        Check data against schema without building an error report.
+        
+        Args:
+            data: Data to check
+            
+        Returns:
+            True if the data matches the schema
+        """
+        return self._validator.is_valid(data)
     
-    def load_and_validate(self, filepath: str) -> Dict[str, Any]:
+    def load_and_validate(self, filepath: str, fast: bool = False) -> Dict[str, Any]:
         """
         Load and validate data from file.
         
         Args:
             filepath: Path to the data file
+            fast: Only check pass/fail, raising a ValueError without error
+                details when the data is invalid
             
         Returns:
             Validated data dictionary
@@ -176,10 +383,69 @@ class DataHandler:
             Various exceptions for file/validation errors
         """
         data = self.load_data(filepath)
-        self.validate_data(data)
+        if fast:
+            if not self.is_valid(data):
+                raise ValueError(f"Invalid CV data: {filepath} does not match the schema")
+        else:
+            self.validate_data(data)
         return data
     
-    def save_data(self, data: Dict[str, Any], filepath: str, 
+    def validate_many(self, filepaths: Iterable[str]) -> Iterator[Tuple[str, bool, Optional[Exception]]]:
+        """
+        Load and validate several files with this handler's compiled validator.
+        
+        Valid files are only checked pass/fail; the detailed validation is
+        re-run just for files that fail, to report their first error.
+        
+        Args:
+            filepaths: Paths of the data files
+            
+        Yields:
+            (filepath, ok, error) tuples; error is None for valid files, else
+            the load error or the first jsonschema.ValidationError
+        """
+        for filepath in filepaths:
+            try:
+                data = self.load_data(filepath)
+            except (OSError, ImportError, ValueError) as e:
+                # OSError covers missing files as well as directories and unreadable paths
+                yield filepath, False, e
+                continue
+            if self._validator.is_valid(data):
+                yield filepath, True, None
+                continue
+            try:
+                self._validator.validate(data)
+            except jsonschema.ValidationError as e:
+                yield filepath, False, e
+            else:
+                # The fast check can reject what jsonschema accepts; jsonschema decides
+                yield filepath, True, None
+    
+    def convert(self, input_path: str, output_path: str, pretty: bool = True,
+                validate: bool = True) -> str:
+        """
+        Convert a data file to the format given by output_path's extension.
+        
+        Args:
+            input_path: Path to the JSON or YAML input file
+            output_path: Output file path
+            pretty: Whether to format output nicely
+            validate: Whether to validate the data before writing it; skipping
+                validation makes this a plain load and save
+            
+        Returns:
+            The output format, 'json' or 'yaml'
+            
+        Raises:
+            jsonschema.ValidationError: If validate is True and the data is invalid
+        """
+        output_format = self.detect_format(output_path)
+        data = self.load_and_validate(input_path) if validate else self.load_data(input_path)
+        self.save_data(data, output_path, format_type=output_format, pretty=pretty)
+        return output_format
+    
+    def save_data(self, data: Dict[str, Any], filepath: Union[str, BinaryIO], 
                   format_type: Optional[Literal['json', 'yaml']] = None,
                   pretty: bool = True) -> None:
         """
@@ -187,21 +453,28 @@ class DataHandler:
         
         Args:
             data: Data to save
-            filepath: Output file path
-            format_type: 'json' or 'yaml'. If None, detected from filepath
+            filepath: Output file path, or a binary file object to write to
+            format_type: 'json' or 'yaml'. If None, detected from filepath;
+                required when writing to a file object
             pretty: Whether to format output nicely
         """
+        is_stream = hasattr(filepath, 'write')
         if format_type is None:
+            if is_stream:
+                raise ValueError("format_type is required when saving to a file object")
             format_type = self.detect_format(filepath)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            if format_type == 'json':
-                if pretty:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
-            else:  # yaml
-                if not YAML_AVAILABLE:
-                    raise ImportError("PyYAML is required for YAML file support. Install with: pip install PyYAML")
-                yaml.dump(data, f, default_flow_style=False, 
-                         allow_unicode=True, sort_keys=False)
+        # Serialize first so the file is written in a single call
+        if format_type == 'json':
+            content = _json_dumps(data, pretty)
+        else:  # yaml
+            if not YAML_AVAILABLE:
+                raise ImportError("PyYAML is required for YAML file support. Install with: pip install PyYAML")
+            content = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False,
+                                allow_unicode=True, sort_keys=False).encode('utf-8')
+        
+        if is_stream:
+            filepath.write(content)
+            return
+        with open(filepath, 'wb') as f:
+            f.write(content)
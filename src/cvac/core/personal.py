@@ -0,0 +1,21 @@
+"""
+Helpers for the personalInfo block of CV data.
+"""
+
+from typing import Dict, Any
+
+NAME_FIELDS = ("firstName", "middleName", "lastName")
+
+
+def full_name(personal_info: Dict[str, Any]) -> str:
+    """
+    Join the non-empty name parts of personalInfo with single spaces.
+    
+    Args:
+        personal_info: The CV's personalInfo mapping
+        
+    Returns:
+        The full name, or an empty string if no name part is set
+    """
+    get = personal_info.get
+    return " ".join(filter(None, (get(key) for key in NAME_FIELDS)))
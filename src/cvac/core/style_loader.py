@@ -2,24 +2,62 @@
 Style loader for handling external style configurations.
 """
 
-import json
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from copy import deepcopy
+from typing import Dict, Any, Optional, Tuple
 import jsonschema
 
 # Try to import yaml, but don't fail if not available
 try:
     import yaml
     YAML_AVAILABLE = True
+    # libyaml's C loader when PyYAML was built with it
+    _YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
     yaml = None
     YAML_AVAILABLE = False
 
+from .data_handler import get_validator, json_loads, load_schema, schema_key
+
 # Import default style
 from ..style import STYLE_CONFIG as DEFAULT_STYLE
 
 
+@lru_cache(maxsize=None)
+def _unit_map() -> Dict[str, Dict[str, Any]]:
+    """Return the docx unit applied to plain numbers in each style section, by key.
+    
+    python-docx is imported on first unit conversion, so loading or validating
+    styles alone does not pay for importing the whole package.
+    """
+    from docx.shared import Pt, Cm, Mm
+    return {
+        # Margins are in millimeters
+        'margins': {'top': Mm, 'bottom': Mm, 'left': Mm, 'right': Mm},
+        'bullet_style': {
+            # Indents are in centimeters, spacing in points
+            'left_indent': Cm,
+            'first_line_indent': Cm,
+            'space_after': Pt,
+            'space_before': Pt,
+        },
+    }
+
+
+_PLAIN_NUMBERS = (int, float)
+
+
+def _clone_style(style: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the nested dicts of a style config, sharing its immutable leaf values.
+    
+    Style values are numbers, strings and docx Length objects, so this is
+    equivalent to deepcopy without its per-object memo bookkeeping.
+    """
+    return {key: _clone_style(value) if type(value) is dict else value
+            for key, value in style.items()}
+
+
 class StyleLoader:
     """Loads and validates style configurations from external files."""
     
@@ -61,6 +99,11 @@ class StyleLoader:
             }
         }
     }
+    _DEFAULT_STYLE_CONVERTED = None
+    # Merged and converted style files, keyed by (resolved path, mtime, validator id);
+    # only the MAX_CACHED_STYLES most recently used are kept. Treat as read-only
+    _STYLE_CACHE: 'OrderedDict[Tuple[str, int, int], Dict[str, Any]]' = OrderedDict()
+    MAX_CACHED_STYLES = 8
     
     def __init__(self, schema_path: Optional[str] = None):
         """
@@ -70,10 +113,18 @@ class StyleLoader:
             schema_path: Optional path to custom style schema
         """
         if schema_path:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                self.schema = json.load(f)
+            self.schema = load_schema(schema_path)
+            self._validator = get_validator(schema_path, self.schema)
         else:
             self.schema = self.STYLE_SCHEMA
+            self._validator = _DEFAULT_STYLE_VALIDATOR
+    
+    @classmethod
+    def _converted_default(cls) -> Dict[str, Any]:
+        """Return DEFAULT_STYLE with units converted, built on first use. Do not mutate."""
+        if cls._DEFAULT_STYLE_CONVERTED is None:
+            cls._DEFAULT_STYLE_CONVERTED = cls._convert_units(_clone_style(DEFAULT_STYLE))
+        return cls._DEFAULT_STYLE_CONVERTED
     
     def detect_format(self, filepath: str) -> str:
         """Detect file format from extension."""
@@ -97,22 +148,31 @@ class StyleLoader:
         """
         if filepath is None:
             # Return default style with proper unit conversion
-            default = deepcopy(DEFAULT_STYLE)
-            return self._convert_units(default)
+            return _clone_style(self._converted_default())
         
-        if not Path(filepath).exists():
+        path = Path(filepath)
+        if not path.exists():
             raise FileNotFoundError(f"Style file not found: {filepath}")
         
+        # Reused until the file changes; validity depends on this loader's schema.
+        # Validators live in module-level caches, so their ids are never reused
+        key = schema_key(path.resolve()) + (id(self._validator),)
+        cached = self._STYLE_CACHE.get(key)
+        if cached is not None:
+            self._STYLE_CACHE.move_to_end(key)
+            return _clone_style(cached)
+        
         format_type = self.detect_format(filepath)
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                if format_type == 'json':
-                    custom_style = json.load(f)
-                else:  # yaml
-                    if not YAML_AVAILABLE:
-                        raise ImportError("PyYAML is required for YAML file support. Install with: pip install PyYAML")
-                    custom_style = yaml.safe_load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            if format_type == 'json':
+                custom_style = json_loads(raw)
+            else:  # yaml
+                if not YAML_AVAILABLE:
+                    raise ImportError("PyYAML is required for YAML file support. Install with: pip install PyYAML")
+                custom_style = yaml.load(raw, Loader=_YamlLoader)
         except Exception as e:
             raise ValueError(f"Error loading style file: {e}")
         
@@ -120,7 +180,10 @@ class StyleLoader:
         self.validate_style(custom_style)
         
         # Merge with defaults (custom values override defaults)
-        return self.merge_with_defaults(custom_style)
+        merged = self._STYLE_CACHE[key] = self.merge_with_defaults(custom_style)
+        if len(self._STYLE_CACHE) > self.MAX_CACHED_STYLES:
+            self._STYLE_CACHE.popitem(last=False)
+        return _clone_style(merged)
     
     def validate_style(self, style_config: Dict[str, Any]) -> None:
         """
@@ -132,8 +195,10 @@ class StyleLoader:
         Raises:
             jsonschema.ValidationError: If validation fails
         """
+        # Stops at the first error; jsonschema.validate() re-checks the schema
+        # and collects every error to pick the best match on each call
         try:
-            jsonschema.validate(instance=style_config, schema=self.schema)
+            self._validator.validate(style_config)
         except jsonschema.ValidationError as e:
             raise ValueError(f"Invalid style configuration: {e.message}")
     
@@ -149,46 +214,46 @@ class StyleLoader:
         Returns:
             Merged style configuration
         """
-        # Start with a deep copy of defaults
-        merged = deepcopy(DEFAULT_STYLE)
+        # Start with a copy of the already-converted defaults
+        merged = _clone_style(self._converted_default())
         
-        # Recursively update with custom values
-        self._deep_update(merged, custom_style)
+        # Convert numeric custom values to proper units; conversion is per key,
+        # so converting before the merge gives the same result as after it
+        custom = self._convert_units(_clone_style(custom_style))
         
-        # Convert numeric values to proper units if needed
-        merged = self._convert_units(merged)
+        # Recursively update with custom values
+        self._deep_update(merged, custom)
         
         return merged
     
     def _deep_update(self, base: Dict[str, Any], update: Dict[str, Any]) -> None:
         """Recursively update base dictionary with update dictionary."""
-        for key, value in update.items():
-            if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-                self._deep_update(base[key], value)
-            else:
-                base[key] = value
+        # Nested dicts are merged from an explicit stack rather than by recursion
+        stack = [(base, update)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                current = base.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
+                else:
+                    base[key] = value
     
-    def _convert_units(self, style: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _convert_units(style: Dict[str, Any]) -> Dict[str, Any]:
         """Convert numeric values to proper docx units."""
-        from docx.shared import Pt, Cm, Mm
-        
-        # Convert margins (assuming mm if just numbers)
-        if 'margins' in style:
-            for key in ['top', 'bottom', 'left', 'right']:
-                if key in style['margins'] and isinstance(style['margins'][key], (int, float)):
-                    style['margins'][key] = Mm(style['margins'][key])
-        
-        # Convert indents (assuming cm if just numbers)
-        if 'bullet_style' in style:
-            if 'left_indent' in style['bullet_style'] and isinstance(style['bullet_style']['left_indent'], (int, float)):
-                style['bullet_style']['left_indent'] = Cm(style['bullet_style']['left_indent'])
-            if 'first_line_indent' in style['bullet_style'] and isinstance(style['bullet_style']['first_line_indent'], (int, float)):
-                style['bullet_style']['first_line_indent'] = Cm(style['bullet_style']['first_line_indent'])
-            
-            # Convert space_after and space_before to Pt
-            for key in ['space_after', 'space_before']:
-                if key in style['bullet_style'] and isinstance(style['bullet_style'][key], (int, float)):
-                    style['bullet_style'][key] = Pt(style['bullet_style'][key])
+        for section, units in _unit_map().items():
+            values = style.get(section)
+            if type(values) is not dict:
+                continue
+            for key, unit in units.items():
+                value = values.get(key)
+                # Exact type check: bools and already-converted Lengths are left alone
+                if type(value) in _PLAIN_NUMBERS:
+                    values[key] = unit(value)
         
         return style
 
+
+# Validator for the built-in STYLE_SCHEMA, shared by every StyleLoader
+_DEFAULT_STYLE_VALIDATOR = jsonschema.Draft7Validator(StyleLoader.STYLE_SCHEMA)
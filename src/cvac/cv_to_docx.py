@@ -1,16 +1,149 @@
+import io
 import json
+import logging
 import os
+import re
 import sys
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
+from urllib.parse import urlsplit
+from zipfile import ZipFile, ZIP_STORED
 from docx import Document
 from docx.shared import Pt, Cm, Mm
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from docx.enum.style import WD_STYLE_TYPE
+from docx.text.paragraph import Paragraph
+from docx.opc.pkgwriter import PackageWriter
 import jsonschema
 from .style import STYLE_CONFIG
+from .core.data_handler import get_validator, json_loads
+from .core.personal import full_name
+
+logger = logging.getLogger(__name__)
+
+# Clark-notation names for every OXML attribute written directly
+_QN = {name: qn(name) for name in ('r:id', 'w:val', 'w:before', 'w:after', 'w:line', 'w:lineRule')}
+_HYPERLINK_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+
+# Private PackageWriter helpers used by _save_package_stored; they may change
+# between python-docx releases, so their presence is checked
+_PACKAGE_WRITER_AVAILABLE = all(
+    hasattr(PackageWriter, name)
+    for name in ('_write_content_types_stream', '_write_pkg_rels', '_write_parts')
+)
+
+
+class _ZipPartWriter:
+    """Physical package writer for ``PackageWriter`` that stores zip members uncompressed.
+
+    python-docx always deflates at zlib's default level, which dominates the
+    save time of a document as small as a CV.
+    """
+
+    def __init__(self, file):
+        self._zipf = ZipFile(file, 'w', compression=ZIP_STORED)
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self._zipf.close()
+
+
+def _save_package_stored(package, file):
+    """Saves an OPC package like ``OpcPackage.save`` but without compressing it.
+
+    Falls back to ``OpcPackage.save`` (deflated) on python-docx versions whose
+    ``PackageWriter`` lacks the helpers used here.
+    """
+    if not _PACKAGE_WRITER_AVAILABLE:
+        package.save(file)
+        return
+    parts = list(package.parts)
+    for part in parts:
+        part.before_marshal()
+    writer = _ZipPartWriter(file)
+    PackageWriter._write_content_types_stream(writer, parts)
+    PackageWriter._write_pkg_rels(writer, package.rels)
+    PackageWriter._write_parts(writer, parts)
+    writer.close()
+
+@lru_cache(maxsize=None)
+def _rpr_template(style_id):
+    """Returns a prebuilt ``w:rPr`` referencing a character style; deepcopy it before use."""
+    rPr = OxmlElement('w:rPr')
+    r_style = OxmlElement('w:rStyle')
+    r_style.set(_QN['w:val'], style_id)
+    rPr.append(r_style)
+    return rPr
+
+@lru_cache(maxsize=None)
+def _hyperlink_template(style_id):
+    """Returns a prebuilt ``w:hyperlink/w:r/w:t``, styled when `style_id` is given; deepcopy it before use."""
+    hyperlink = OxmlElement('w:hyperlink')
+    r = OxmlElement('w:r')
+    if style_id is not None:
+        r.append(deepcopy(_rpr_template(style_id)))
+    r.append(OxmlElement('w:t'))
+    hyperlink.append(r)
+    return hyperlink
+
+@lru_cache(maxsize=None)
+def _ppr_template(style_id, before, after, line, center):
+    """Returns a prebuilt ``w:pPr`` with the given spacing (twips strings); deepcopy it before use."""
+    pPr = OxmlElement('w:pPr')
+    # Children in schema order: pStyle, spacing, jc
+    if style_id is not None:
+        p_style = OxmlElement('w:pStyle')
+        p_style.set(_QN['w:val'], style_id)
+        pPr.append(p_style)
+    spacing = OxmlElement('w:spacing')
+    spacing.set(_QN['w:before'], before)
+    spacing.set(_QN['w:after'], after)
+    spacing.set(_QN['w:line'], line)
+    spacing.set(_QN['w:lineRule'], 'auto')
+    pPr.append(spacing)
+    if center:
+        jc = OxmlElement('w:jc')
+        jc.set(_QN['w:val'], 'center')
+        pPr.append(jc)
+    return pPr
+
+@lru_cache(maxsize=None)
+def _twips(points):
+    """Converts a spacing in points to a ``w:spacing`` twips attribute value."""
+    return str(int(round(points * 20)))
+
+@lru_cache(maxsize=None)
+def _line_twips(multiple):
+    """Converts a line-spacing multiple to a ``w:line`` value (240ths of a line)."""
+    return str(int(round(multiple * 240)))
+
+# Job fields that may hold the company's URL, in order of preference
+_COMPANY_URL_FIELDS = ("companyUrl", "company_url", "website", "url", "link", "homepage")
+
+# Profile URLs shown as "linkedin.com/in/<user>" / "github.com/<user>"
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/([^/?#]+)', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'github\.com/([^/?#]+)', re.IGNORECASE)
+
+# (input, output) strptime/strftime formats tried in order by _format_date
+_DATE_FORMATS = (
+    ("%Y-%m-%d", "%B %d, %Y"),  # Full date
+    ("%Y-%m", "%B %Y"),          # Year and month
+    ("%Y", "%Y"),                # Year only
+)
+
+# YYYY-MM and YYYY-MM-DD with a four-digit year strftime prints unchanged
+_ISO_DATE_RE = re.compile(r'([1-9][0-9]{3})-([0-9]{2})(?:-([0-9]{2}))?\Z')
+
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
 
 class CVData:
     """Handles loading, validation, and access to CV data."""
@@ -22,12 +155,10 @@ class CVData:
     def _load_and_validate_data(self):
         """Loads the JSON data and validates it against the schema."""
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            with open(self.schema_path, 'r', encoding='utf-8') as file:
-                schema = json.load(file)
-            
-            jsonschema.validate(instance=data, schema=schema)
+            data = self._read_json(self.json_path)
+            # Compiled once per schema file version and shared across instances
+            validator = get_validator(self.schema_path)
+            validator.validate(data)
             return data
         except FileNotFoundError as e:
             print(f"Error: {e.filename} not found.")
@@ -39,13 +170,103 @@ class CVData:
             print(f"Error decoding JSON from {self.json_path}")
             sys.exit(1)
 
+    @classmethod
+    def from_validated_dict(cls, data, schema_path=None):
+        """Wraps CV data that was already loaded and validated, skipping both steps."""
+        cv_data = cls.__new__(cls)
+        cv_data.json_path = None
+        cv_data.schema_path = schema_path
+        cv_data.data = data
+        return cv_data
+
+    @staticmethod
+    def _read_json(path):
+        """Reads a JSON file as bytes and parses it, using orjson when available."""
+        with open(path, 'rb') as file:
+            raw = file.read()
+        return json_loads(raw)
+
 class DocxGenerator:
     """Generates the CV document from CVData."""
+
+    # Character styles shared by all runs, keyed by (bold, underline)
+    CHARACTER_STYLES = {
+        (False, False): 'CvBody',
+        (True, False): 'CvBold',
+        (False, True): 'CvLink',
+    }
+
+    # Styled blank documents as (uncompressed .docx bytes, bullet style id,
+    # character style ids), keyed by the JSON-serialized style config. Reopening
+    # a snapshot is cheaper than re-running _apply_document_styles. Only the
+    # most recently used MAX_TEMPLATES styles are kept.
+    _TEMPLATES = OrderedDict()
+    MAX_TEMPLATES = 4
+
+    # Document sections in output order, as (CV data key, builder method name);
+    # generate_bytes only calls a builder when its key holds data
+    SECTIONS = (
+        ("personalInfo", "_create_personal_info_section"),
+        ("professionalSummary", "_create_summary_section"),
+        ("workExperience", "_create_experience_section"),
+        ("education", "_create_education_section"),
+        ("projects", "_create_projects_section"),
+        ("skills", "_create_skills_section"),
+        ("certifications", "_create_certifications_section"),
+        ("publications", "_create_publications_section"),
+        ("awards", "_create_awards_section"),
+        ("volunteerWork", "_create_volunteer_section"),
+        ("languages", "_create_languages_section"),
+        ("references", "_create_references_section"),
+    )
+
     def __init__(self, cv_data, style_config):
         self.cv_data = cv_data
         self.style = style_config
-        self.doc = Document()
-        self._apply_document_styles()
+        # Font sizes and default spacing are fixed per document; convert them once
+        self._font_size = Pt(self.style["font_size"])
+        self._name_font_size = Pt(self.style["name_font_size"])
+        p_spacing = self.style["paragraph_spacing"]
+        self._space_before = _twips(p_spacing["before"])
+        self._space_after = _twips(p_spacing["after"])
+        self._line_spacing = _line_twips(p_spacing["line_spacing"])
+
+        try:
+            template_key = json.dumps(style_config, sort_keys=True)
+        except TypeError:
+            template_key = None  # Not serializable; style every document from scratch
+        template = self._TEMPLATES.get(template_key)
+        if template is not None:
+            self._TEMPLATES.move_to_end(template_key)
+            snapshot, self._bullet_style_id, char_style_ids = template
+            self._open_document(io.BytesIO(snapshot))
+            self._char_style_ids = dict(char_style_ids)
+        else:
+            self._open_document()
+            self._apply_document_styles()
+            if template_key is not None:
+                buffer = io.BytesIO()
+                _save_package_stored(self.doc.part.package, buffer)
+                self._TEMPLATES[template_key] = (buffer.getvalue(), self._bullet_style_id, dict(self._char_style_ids))
+                if len(self._TEMPLATES) > self.MAX_TEMPLATES:
+                    self._TEMPLATES.popitem(last=False)
+
+        # Run properties per character style, indexed by `bold` in _add_run
+        ids = self._char_style_ids
+        self._run_rprs = (_rpr_template(ids[(False, False)]), _rpr_template(ids[(True, False)]))
+        # Hyperlink skeletons indexed by `underline` in _add_hyperlink
+        self._link_templates = (_hyperlink_template(None), _hyperlink_template(ids[(False, True)]))
+
+    def _open_document(self, docx=None):
+        """Opens `docx` (default: python-docx's blank template) and caches its body handles."""
+        self.doc = Document(docx)
+        # doc.styles builds a new wrapper per access and looks names up by XPath
+        self._styles = self.doc.styles
+        self._styles_by_name = {}
+        self._body = self.doc.element.body
+        self._sect_pr = self._body.sectPr
+        # Hyperlink rIds by URL; relate_to scans every relationship to find a match
+        self._link_rids = {}
 
     def _apply_document_styles(self):
         """Applies base styles and margins to the document."""
@@ -55,41 +276,83 @@ class DocxGenerator:
             section.left_margin = self.style["margins"]["left"]
             section.right_margin = self.style["margins"]["right"]
 
-        style = self.doc.styles['Normal']
+        style = self._get_style('Normal')
         style.font.name = self.style["font_name"]
-        style.font.size = Pt(self.style["font_size"])
+        style.font.size = self._font_size
         
         self._create_custom_bullet_style()
+        self._create_character_styles()
+
+    def _get_style(self, name):
+        """Returns the document style called `name`, memoizing the lookup."""
+        style = self._styles_by_name.get(name)
+        if style is None:
+            style = self._styles_by_name[name] = self._styles[name]
+        return style
+
+    def _add_style(self, name, style_type):
+        """Adds a new style to the document and registers it for `_get_style`."""
+        style = self._styles_by_name[name] = self._styles.add_style(name, style_type)
+        return style
 
     def _create_custom_bullet_style(self):
         """Creates the custom bullet style."""
         bullet_style_def = self.style["bullet_style"]
-        list_style = self.doc.styles.add_style('CustomBulletStyle', WD_STYLE_TYPE.PARAGRAPH)
-        list_style.base_style = self.doc.styles['List Bullet']
+        list_style = self._add_style('CustomBulletStyle', WD_STYLE_TYPE.PARAGRAPH)
+        list_style.base_style = self._get_style('List Bullet')
         list_style.paragraph_format.left_indent = bullet_style_def["left_indent"]
         list_style.paragraph_format.first_line_indent = bullet_style_def["first_line_indent"]
         list_style.paragraph_format.line_spacing = bullet_style_def["line_spacing"]
         list_style.paragraph_format.space_after = bullet_style_def["space_after"]
         list_style.paragraph_format.space_before = bullet_style_def["space_before"]
         list_style.font.name = self.style["font_name"]
-        list_style.font.size = Pt(self.style["font_size"])
-
-    def generate(self, output_path):
-        """Generates and saves the full CV document."""
-        self._create_personal_info_section()
-        self._create_summary_section()
-        self._create_experience_section()
-        self._create_education_section()
-        self._create_projects_section()
-        self._create_skills_section()
-        self._create_certifications_section()
-        self._create_publications_section()
-        self._create_awards_section()
-        self._create_volunteer_section()
-        self._create_languages_section()
-        self._create_references_section()
-        self.doc.save(output_path)
-        print(f"CV saved as {output_path}")
+        list_style.font.size = self._font_size
+        self._bullet_style_id = list_style.style_id
+
+    def _create_character_styles(self):
+        """Creates the character styles referenced by runs instead of inline fonts."""
+        self._char_style_ids = {}
+        for (bold, underline), name in self.CHARACTER_STYLES.items():
+            char_style = self._add_style(name, WD_STYLE_TYPE.CHARACTER)
+            char_style.font.name = self.style["font_name"]
+            char_style.font.size = self._font_size
+            char_style.font.bold = bold
+            if underline:
+                char_style.font.underline = True
+            self._char_style_ids[(bold, underline)] = char_style.style_id
+
+    def generate(self, output_path, compress=True):
+        """Generates and saves the full CV document.
+
+        `output_path` may also be a binary file object, which is written to
+        but not closed. With `compress` False the archive members are stored
+        uncompressed, trading file size for save time; by default the file is
+        deflated as python-docx saves it.
+        """
+        # Serialized in memory so the finished archive reaches the OS in one write
+        content = self.generate_bytes(compress)
+        if hasattr(output_path, 'write'):
+            output_path.write(content)
+            return
+        with open(output_path, 'wb') as file:
+            file.write(content)
+        logger.info("CV saved as %s", output_path)
+
+    def generate_bytes(self, compress=True):
+        """Generates the full CV document and returns the .docx file contents.
+
+        For callers that upload or stream the document instead of saving it.
+        """
+        data = self.cv_data.data
+        for key, builder in self.SECTIONS:
+            if data.get(key):
+                getattr(self, builder)()
+        buffer = io.BytesIO()
+        if compress:
+            self.doc.save(buffer)
+        else:
+            _save_package_stored(self.doc.part.package, buffer)
+        return buffer.getvalue()
 
     def _create_personal_info_section(self):
         personal_info = self.cv_data.data.get("personalInfo", {})
@@ -97,32 +360,36 @@ class DocxGenerator:
             return
 
         # Full Name
-        name_parts = [personal_info.get(key) for key in ["firstName", "middleName", "lastName"] if personal_info.get(key)]
-        full_name = " ".join(name_parts)
-        if full_name:
-            name_para = self.doc.add_paragraph()
-            name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            name_run = name_para.add_run(full_name)
-            name_run.font.size = Pt(self.style["name_font_size"])
-            name_run.font.name = self.style["font_name"]
+        name = full_name(personal_info)
+        if name:
+            name_para = self._add_spaced_paragraph(after=3, center=True)
+            # The font name comes from Normal; only size and weight differ
+            name_run = name_para.add_run(name)
+            name_run.font.size = self._name_font_size
             name_run.font.bold = True
-            self._set_paragraph_spacing(name_para, after=3)
 
         # Contact Info Rows
-        self._add_contact_row([
-            {"text": personal_info.get("email"), "url": f"mailto:{personal_info.get('email')}"},
-            {"text": personal_info.get("phone"), "url": f"tel:{personal_info.get('phone')}"}
-        ])
+        contact_row1 = []
+        email = personal_info.get("email")
+        if email:
+            contact_row1.append((email, f"mailto:{email}"))
+        phone = personal_info.get("phone")
+        if phone:
+            contact_row1.append((phone, f"tel:{phone}"))
+        self._add_contact_row(contact_row1)
         
-        contact_row2_items = []
-        if personal_info.get("linkedIn"):
-            contact_row2_items.append({"text": self._format_url(personal_info["linkedIn"]), "url": personal_info["linkedIn"]})
-        if personal_info.get("githubUrl"):
-            contact_row2_items.append({"text": self._format_url(personal_info["githubUrl"]), "url": personal_info["githubUrl"]})
-        for field in ["website", "portfolio", "blog"]:
-            if personal_info.get(field):
-                contact_row2_items.append({"text": self._extract_domain(personal_info[field]), "url": personal_info[field]})
-        self._add_contact_row(contact_row2_items, after=3)
+        contact_row2_fields = (
+            ("linkedIn", self._format_url),
+            ("githubUrl", self._format_url),
+            ("website", self._extract_domain),
+            ("portfolio", self._extract_domain),
+            ("blog", self._extract_domain),
+        )
+        self._add_contact_row([
+            (display(personal_info[field]), personal_info[field])
+            for field, display in contact_row2_fields
+            if personal_info.get(field)
+        ], after=3)
 
     def _create_summary_section(self):
         """Creates the professional summary section."""
@@ -131,27 +398,21 @@ class DocxGenerator:
             return
         
         self._add_section_header("PROFESSIONAL SUMMARY")
-        summary_para = self.doc.add_paragraph()
-        self._set_paragraph_spacing(summary_para, after=3)
-        summary_run = summary_para.add_run(summary)
-        self._set_font_properties(summary_run)
+        summary_para = self._add_spaced_paragraph(after=3)
+        self._add_run(summary_para, summary)
 
     def _add_contact_row(self, items, after=2):
-        items = [item for item in items if item.get("text")]
+        """Adds a centered row of " | "-separated links from (text, url) pairs."""
+        items = [item for item in items if item[0]]
         if not items:
             return
         
-        para = self.doc.add_paragraph()
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        self._set_paragraph_spacing(para, after=after)
+        para = self._add_spaced_paragraph(after=after, center=True)
         
-        for i, item in enumerate(items):
+        for i, (text, url) in enumerate(items):
             if i > 0:
-                para.add_run(" | ")
-            self._add_hyperlink(para, item["url"], item["text"])
-        
-        for run in para.runs:
-            self._set_font_properties(run)
+                self._add_run(para, " | ")
+            self._add_hyperlink(para, url, text)
 
     def _create_experience_section(self):
         work_experience = self.cv_data.data.get("workExperience", [])
@@ -159,57 +420,57 @@ class DocxGenerator:
             return
         
         self._add_section_header("EXPERIENCE")
+        # Bind per-entry helpers once for the loop
+        start_line = self._start_line
+        add_run = self._add_run
+        add_bullet = self._add_bullet_point
+        format_date = self._format_date
         for job in work_experience:
-            if job.get("company"):
-                company_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(company_para)
-                company_run = company_para.add_run(job["company"])
-                self._set_font_properties(company_run, bold=True)
+            get = job.get
+            # Company, position and dates share one paragraph, one line each
+            header_para = None
+            company = get("company")
+            if company:
+                header_para = start_line(header_para)
+                add_run(header_para, company, bold=True)
                 
                 # Add location if available
-                if job.get("location"):
-                    company_para.add_run(f" | {job['location']}")
-                    for run in company_para.runs[-1:]:
-                        self._set_font_properties(run, bold=True)
+                location = get("location")
+                if location:
+                    add_run(header_para, f" | {location}", bold=True)
                 
                 company_url = self._find_company_url(job)
                 if company_url:
-                    company_para.add_run(" (")
-                    self._add_hyperlink(company_para, company_url, self._extract_domain(company_url), underline=False)
-                    company_para.add_run(")")
-                    for run in company_para.runs:
-                        self._set_font_properties(run, bold=True)
-
-            if job.get("position"):
-                position_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(position_para)
-                position_run = position_para.add_run(job["position"])
-                self._set_font_properties(position_run, bold=True)
-
-            start_date = self._format_date(job.get("startDate"))
-            end_date = "Present" if job.get("current") else self._format_date(job.get("endDate"))
+                    add_run(header_para, " (", bold=True)
+                    self._add_hyperlink(header_para, company_url, self._extract_domain(company_url), underline=False)
+                    add_run(header_para, ")", bold=True)
+
+            position = get("position")
+            if position:
+                header_para = start_line(header_para)
+                add_run(header_para, position, bold=True)
+
+            start_date = format_date(get("startDate"))
+            end_date = "Present" if get("current") else format_date(get("endDate"))
             if start_date or end_date:
-                date_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(date_para)
+                header_para = start_line(header_para)
                 date_range = f"{start_date} - {end_date}" if start_date and end_date else start_date or end_date
-                date_run = date_para.add_run(date_range)
-                self._set_font_properties(date_run)
+                add_run(header_para, date_range)
 
-            if job.get("description"):
-                self._add_bullet_point(job["description"])
+            description = get("description")
+            if description:
+                add_bullet(description)
 
-            for achievement in job.get("achievements", []):
+            for achievement in get("achievements", []):
                 if achievement:
-                    self._add_bullet_point(achievement if achievement.endswith('.') else f"{achievement}.")
+                    add_bullet(achievement if achievement.endswith('.') else f"{achievement}.")
             
             # Add technologies if available
-            if job.get("technologies"):
-                tech_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(tech_para, after=3)
-                tech_run = tech_para.add_run("Technologies used: ")
-                self._set_font_properties(tech_run, bold=True)
-                tech_list_run = tech_para.add_run(", ".join(job["technologies"]))
-                self._set_font_properties(tech_list_run)
+            technologies = get("technologies")
+            if technologies:
+                tech_para = self._add_spaced_paragraph(after=3)
+                add_run(tech_para, "Technologies used: ", bold=True)
+                add_run(tech_para, ", ".join(technologies))
 
     def _create_education_section(self):
         education = self.cv_data.data.get("education", [])
@@ -217,48 +478,50 @@ class DocxGenerator:
             return
 
         self._add_section_header("EDUCATION")
+        # Bind per-entry helpers once for the loop
+        start_line = self._start_line
+        add_run = self._add_run
+        add_bullet = self._add_bullet_point
         for edu in education:
-            if edu.get("institution"):
-                inst_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(inst_para)
-                inst_run = inst_para.add_run(edu["institution"])
-                self._set_font_properties(inst_run)
-
-            degree_parts = [edu.get("degree"), edu.get("field")]
-            if any(degree_parts):
-                degree_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(degree_para)
-                degree_run = degree_para.add_run(" | ".join(filter(None, degree_parts)))
-                self._set_font_properties(degree_run)
+            get = edu.get
+            # Institution, degree and location/graduation share one paragraph
+            edu_para = None
+            institution = get("institution")
+            if institution:
+                edu_para = start_line(edu_para)
+                add_run(edu_para, institution)
+
+            degree_text = " | ".join(filter(None, (get("degree"), get("field"))))
+            if degree_text:
+                edu_para = start_line(edu_para)
+                add_run(edu_para, degree_text)
                 
                 # Add GPA if available
-                if edu.get("gpa"):
-                    degree_para.add_run(f" | GPA: {edu['gpa']:.2f}/4.0")
-                    for run in degree_para.runs[-1:]:
-                        self._set_font_properties(run)
-
-            loc_grad_parts = [edu.get("location")]
-            if edu.get("graduationDate"):
-                loc_grad_parts.append(f"Graduated in {self._format_date(edu['graduationDate'])}")
-            if any(loc_grad_parts):
-                loc_date_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(loc_date_para, after=3)
-                loc_date_run = loc_date_para.add_run(" | ".join(filter(None, loc_grad_parts)))
-                self._set_font_properties(loc_date_run)
+                gpa = get("gpa")
+                if gpa:
+                    add_run(edu_para, f" | GPA: {gpa:.2f}/4.0")
+
+            graduation_date = get("graduationDate")
+            loc_grad_text = " | ".join(filter(None, (
+                get("location"),
+                graduation_date and f"Graduated in {self._format_date(graduation_date)}",
+            )))
+            if loc_grad_text:
+                edu_para = start_line(edu_para)
+                self._set_paragraph_spacing(edu_para, after=3)
+                add_run(edu_para, loc_grad_text)
             
             # Add honors if available
-            for honor in edu.get("honors", []):
+            for honor in get("honors", []):
                 if honor:
-                    self._add_bullet_point(honor)
+                    add_bullet(honor)
             
             # Add relevant courses if available
-            if edu.get("relevantCourses"):
-                courses_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(courses_para, after=3)
-                courses_run = courses_para.add_run("Relevant Courses: ")
-                self._set_font_properties(courses_run, bold=True)
-                courses_list_run = courses_para.add_run(", ".join(edu["relevantCourses"]))
-                self._set_font_properties(courses_list_run)
+            relevant_courses = get("relevantCourses")
+            if relevant_courses:
+                courses_para = self._add_spaced_paragraph(after=3)
+                add_run(courses_para, "Relevant Courses: ", bold=True)
+                add_run(courses_para, ", ".join(relevant_courses))
 
     def _create_projects_section(self):
         """Creates the projects section."""
@@ -267,51 +530,46 @@ class DocxGenerator:
             return
         
         self._add_section_header("PROJECTS")
+        add_run = self._add_run
+        format_date = self._format_date
         for project in projects:
+            get = project.get
             # Project name with optional URL
-            if project.get("name"):
-                project_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(project_para)
+            name = get("name")
+            if name:
+                project_para = self._add_spaced_paragraph()
                 
-                if project.get("url"):
-                    self._add_hyperlink(project_para, project["url"], project["name"])
-                    # Make the hyperlink bold
-                    for run in project_para.runs:
-                        self._set_font_properties(run, bold=True)
+                url = get("url")
+                if url:
+                    self._add_hyperlink(project_para, url, name)
                 else:
-                    project_run = project_para.add_run(project["name"])
-                    self._set_font_properties(project_run, bold=True)
+                    add_run(project_para, name, bold=True)
             
             # Dates
-            start_date = self._format_date(project.get("startDate"))
-            end_date = self._format_date(project.get("endDate"))
+            start_date = format_date(get("startDate"))
+            end_date = format_date(get("endDate"))
             if start_date or end_date:
-                date_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(date_para)
+                date_para = self._add_spaced_paragraph()
                 date_range = f"{start_date} - {end_date}" if start_date and end_date else start_date or end_date or ""
-                date_run = date_para.add_run(date_range)
-                self._set_font_properties(date_run)
+                add_run(date_para, date_range)
             
             # Description
-            if project.get("description"):
-                desc_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(desc_para)
-                desc_run = desc_para.add_run(project["description"])
-                self._set_font_properties(desc_run)
+            description = get("description")
+            if description:
+                desc_para = self._add_spaced_paragraph()
+                add_run(desc_para, description)
             
             # Highlights
-            for highlight in project.get("highlights", []):
+            for highlight in get("highlights", []):
                 if highlight:
                     self._add_bullet_point(highlight if highlight.endswith('.') else f"{highlight}.")
             
             # Technologies
-            if project.get("technologies"):
-                tech_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(tech_para, after=3)
-                tech_run = tech_para.add_run("Technologies: ")
-                self._set_font_properties(tech_run, bold=True)
-                tech_list_run = tech_para.add_run(", ".join(project["technologies"]))
-                self._set_font_properties(tech_list_run)
+            technologies = get("technologies")
+            if technologies:
+                tech_para = self._add_spaced_paragraph(after=3)
+                add_run(tech_para, "Technologies: ", bold=True)
+                add_run(tech_para, ", ".join(technologies))
 
     def _create_languages_section(self):
         languages = self.cv_data.data.get("languages", [])
@@ -319,84 +577,68 @@ class DocxGenerator:
             return
         
         self._add_section_header("LANGUAGES")
-        lang_entries = [self._format_language_entry(lang) for lang in languages]
-        if lang_entries:
-            lang_para = self.doc.add_paragraph()
-            self._set_paragraph_spacing(lang_para, after=3)
-            lang_run = lang_para.add_run(", ".join(filter(None, lang_entries)))
-            self._set_font_properties(lang_run)
+        # Format, drop empties and join in a single pass over the entries
+        lang_text = ", ".join(entry for entry in map(self._format_language_entry, languages) if entry)
+        lang_para = self._add_spaced_paragraph(after=3)
+        self._add_run(lang_para, lang_text)
 
     def _create_skills_section(self):
         skills = self.cv_data.data.get("skills", [])
         if not skills:
             return
         
-        # Check if skills have categories
-        has_categories = any(isinstance(skill, dict) and skill.get("category") for skill in skills)
+        # One pass collects both layouts; categories are used if any skill has one
+        categories = {}
+        uncategorized = []
+        skill_names = []
+        has_categories = False
+        # Exact type checks: loaded JSON/YAML only yields plain str and dict
+        for skill in skills:
+            skill_type = type(skill)
+            if skill_type is str:
+                uncategorized.append(skill)
+                if skill:
+                    skill_names.append(skill)
+            elif skill_type is dict:
+                get = skill.get
+                name = get("name", "")
+                level = get("level")
+                skill_info = f"{name} ({level})" if level else name
+                if name:
+                    skill_names.append(skill_info)
+                if get("category"):
+                    has_categories = True
+                category = get("category", "Other")
+                if category:
+                    categories.setdefault(category, []).append(skill_info)
+                else:
+                    uncategorized.append(skill_info)
         
         self._add_section_header("SKILLS" if has_categories else "TECHNOLOGIES")
         
         if has_categories:
-            # Group skills by category
-            from collections import defaultdict
-            categories = defaultdict(list)
-            uncategorized = []
-            
-            for skill in skills:
-                if isinstance(skill, dict):
-                    category = skill.get("category", "Other")
-                    skill_info = skill.get("name", "")
-                    if skill.get("level"):
-                        skill_info += f" ({skill['level']})"
-                    if category:
-                        categories[category].append(skill_info)
-                    else:
-                        uncategorized.append(skill_info)
-                elif isinstance(skill, str):
-                    uncategorized.append(skill)
-            
             # Render categorized skills
             for category, skill_list in categories.items():
                 if skill_list:
-                    cat_para = self.doc.add_paragraph()
-                    self._set_paragraph_spacing(cat_para)
-                    cat_run = cat_para.add_run(f"{category}: ")
-                    self._set_font_properties(cat_run, bold=True)
-                    skills_run = cat_para.add_run(", ".join(skill_list))
-                    self._set_font_properties(skills_run)
+                    cat_para = self._add_spaced_paragraph()
+                    self._add_run(cat_para, f"{category}: ", bold=True)
+                    self._add_run(cat_para, ", ".join(skill_list))
             
             # Render uncategorized skills
             if uncategorized:
-                uncat_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(uncat_para)
-                uncat_run = uncat_para.add_run("Other: " if categories else "")
+                uncat_para = self._add_spaced_paragraph()
                 if categories:
-                    self._set_font_properties(uncat_run, bold=True)
-                skills_run = uncat_para.add_run(", ".join(uncategorized))
-                self._set_font_properties(skills_run)
+                    self._add_run(uncat_para, "Other: ", bold=True)
+                self._add_run(uncat_para, ", ".join(uncategorized))
         else:
             # Simple list format (existing behavior)
-            skill_names = []
-            for skill in skills:
-                if isinstance(skill, dict):
-                    name = skill.get("name")
-                    if name:
-                        if skill.get("level"):
-                            skill_names.append(f"{name} ({skill['level']})")
-                        else:
-                            skill_names.append(name)
-                elif isinstance(skill, str):
-                    skill_names.append(skill)
-            
-            skill_names = list(filter(None, skill_names))
             if skill_names:
                 skills_text = ", ".join(skill_names)
                 if not skills_text.endswith("."):
                     skills_text += "."
                 
-                tech_para = self.doc.add_paragraph()
-                tech_run = tech_para.add_run(skills_text)
-                self._set_font_properties(tech_run)
+                tech_para = self._add_paragraph()
+                self._add_run(tech_para, skills_text)
 
     def _create_certifications_section(self):
         """Creates the certifications section."""
@@ -405,42 +647,42 @@ class DocxGenerator:
             return
         
         self._add_section_header("CERTIFICATIONS")
+        add_run = self._add_run
         for cert in certifications:
-            cert_para = self.doc.add_paragraph()
-            self._set_paragraph_spacing(cert_para, after=3)
+            get = cert.get
+            cert_para = self._add_spaced_paragraph(after=3)
             
             # Certification name (bold)
-            if cert.get("name"):
-                cert_run = cert_para.add_run(cert["name"])
-                self._set_font_properties(cert_run, bold=True)
+            name = get("name")
+            if name:
+                add_run(cert_para, name, bold=True)
+            
+            # Plain-text details share a single run
+            details = []
             
             # Issuer
-            if cert.get("issuer"):
-                cert_para.add_run(f", {cert['issuer']}")
-                for run in cert_para.runs[-1:]:
-                    self._set_font_properties(run)
+            issuer = get("issuer")
+            if issuer:
+                details.append(f", {issuer}")
             
             # Date obtained
-            if cert.get("dateObtained"):
-                date_str = self._format_date(cert["dateObtained"])
-                cert_para.add_run(f", Issued {date_str}")
-                for run in cert_para.runs[-1:]:
-                    self._set_font_properties(run)
+            date_obtained = get("dateObtained")
+            if date_obtained:
+                details.append(f", Issued {self._format_date(date_obtained)}")
             
             # Expiry date
-            if cert.get("expiryDate"):
-                expiry_str = self._format_date(cert["expiryDate"])
-                cert_para.add_run(f" (Expires {expiry_str})")
-                for run in cert_para.runs[-1:]:
-                    self._set_font_properties(run)
+            expiry_date = get("expiryDate")
+            if expiry_date:
+                details.append(f" (Expires {self._format_date(expiry_date)})")
             
             # Credential URL
-            if cert.get("credentialUrl"):
-                cert_para.add_run(" ")
-                self._add_hyperlink(cert_para, cert["credentialUrl"], "[View Certificate]")
-                for run in cert_para.runs:
-                    if run.text and run.text not in ["[View Certificate]"]:
-                        self._set_font_properties(run)
+            credential_url = get("credentialUrl")
+            if credential_url:
+                details.append(" ")
+            if details:
+                add_run(cert_para, "".join(details))
+            if credential_url:
+                self._add_hyperlink(cert_para, credential_url, "[View Certificate]")
 
     def _create_publications_section(self):
         """Creates the publications section."""
@@ -449,43 +691,45 @@ class DocxGenerator:
             return
         
         self._add_section_header("PUBLICATIONS")
+        add_run = self._add_run
         for pub in publications:
-            pub_para = self.doc.add_paragraph()
-            self._set_paragraph_spacing(pub_para, after=3)
+            get = pub.get
+            pub_para = self._add_spaced_paragraph(after=3)
             
             # Title (bold)
-            if pub.get("title"):
-                title_run = pub_para.add_run(pub["title"])
-                self._set_font_properties(title_run, bold=True)
+            title = get("title")
+            if title:
+                add_run(pub_para, title, bold=True)
+            
+            # Plain-text details share a single run
+            details = []
             
             # Authors
-            if pub.get("authors") and isinstance(pub["authors"], list):
-                authors_str = ", ".join(pub["authors"])
-                pub_para.add_run(f". {authors_str}")
-                for run in pub_para.runs[-1:]:
-                    self._set_font_properties(run)
+            authors = get("authors")
+            if authors and isinstance(authors, list):
+                details.append(f". {', '.join(authors)}")
             
             # Publisher
-            if pub.get("publisher"):
-                pub_para.add_run(f". {pub['publisher']}")
-                for run in pub_para.runs[-1:]:
-                    self._set_font_properties(run)
+            publisher = get("publisher")
+            if publisher:
+                details.append(f". {publisher}")
             
             # Date
-            if pub.get("date"):
-                date_str = self._format_date(pub["date"])
-                pub_para.add_run(f", {date_str}")
-                for run in pub_para.runs[-1:]:
-                    self._set_font_properties(run)
+            date = get("date")
+            if date:
+                details.append(f", {self._format_date(date)}")
             
             # DOI or URL
-            if pub.get("doi"):
-                pub_para.add_run(" ")
-                doi_url = f"https://doi.org/{pub['doi']}"
-                self._add_hyperlink(pub_para, doi_url, f"DOI: {pub['doi']}")
-            elif pub.get("url"):
-                pub_para.add_run(" ")
-                self._add_hyperlink(pub_para, pub["url"], "[Link]")
+            doi = get("doi")
+            url = get("url")
+            if doi or url:
+                details.append(" ")
+            if details:
+                add_run(pub_para, "".join(details))
+            if doi:
+                self._add_hyperlink(pub_para, f"https://doi.org/{doi}", f"DOI: {doi}")
+            elif url:
+                self._add_hyperlink(pub_para, url, "[Link]")
 
     def _create_awards_section(self):
         """Creates the awards section."""
@@ -494,34 +738,32 @@ class DocxGenerator:
             return
         
         self._add_section_header("AWARDS & HONORS")
+        add_run = self._add_run
         for award in awards:
-            award_para = self.doc.add_paragraph()
-            self._set_paragraph_spacing(award_para, after=3)
+            get = award.get
+            award_para = self._add_spaced_paragraph(after=3)
             
             # Award name (bold)
-            if award.get("name"):
-                award_run = award_para.add_run(award["name"])
-                self._set_font_properties(award_run, bold=True)
+            name = get("name")
+            if name:
+                add_run(award_para, name, bold=True)
             
-            # Issuer
-            if award.get("issuer"):
-                award_para.add_run(f", {award['issuer']}")
-                for run in award_para.runs[-1:]:
-                    self._set_font_properties(run)
-            
-            # Date
-            if award.get("date"):
-                date_str = self._format_date(award["date"])
-                award_para.add_run(f", {date_str}")
-                for run in award_para.runs[-1:]:
-                    self._set_font_properties(run)
+            # Issuer and date share a single run
+            details = []
+            issuer = get("issuer")
+            if issuer:
+                details.append(f", {issuer}")
+            date = get("date")
+            if date:
+                details.append(f", {self._format_date(date)}")
+            if details:
+                add_run(award_para, "".join(details))
             
             # Description
-            if award.get("description"):
-                desc_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(desc_para, after=3)
-                desc_run = desc_para.add_run(award["description"])
-                self._set_font_properties(desc_run)
+            description = get("description")
+            if description:
+                desc_para = self._add_spaced_paragraph(after=3)
+                add_run(desc_para, description)
 
     def _create_volunteer_section(self):
         """Creates the volunteer work section."""
@@ -530,34 +772,34 @@ class DocxGenerator:
             return
         
         self._add_section_header("VOLUNTEER WORK")
+        add_run = self._add_run
+        format_date = self._format_date
         for work in volunteer_work:
+            get = work.get
             # Organization name
-            if work.get("organization"):
-                org_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(org_para)
-                org_run = org_para.add_run(work["organization"])
-                self._set_font_properties(org_run, bold=True)
+            organization = get("organization")
+            if organization:
+                org_para = self._add_spaced_paragraph()
+                add_run(org_para, organization, bold=True)
             
             # Role
-            if work.get("role"):
-                role_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(role_para)
-                role_run = role_para.add_run(work["role"])
-                self._set_font_properties(role_run)
+            role = get("role")
+            if role:
+                role_para = self._add_spaced_paragraph()
+                add_run(role_para, role)
             
             # Dates
-            start_date = self._format_date(work.get("startDate"))
-            end_date = self._format_date(work.get("endDate"))
+            start_date = format_date(get("startDate"))
+            end_date = format_date(get("endDate"))
             if start_date or end_date:
-                date_para = self.doc.add_paragraph()
-                self._set_paragraph_spacing(date_para)
+                date_para = self._add_spaced_paragraph()
                 date_range = f"{start_date} - {end_date}" if start_date and end_date else start_date or end_date or ""
-                date_run = date_para.add_run(date_range)
-                self._set_font_properties(date_run)
+                add_run(date_para, date_range)
             
             # Description
-            if work.get("description"):
-                self._add_bullet_point(work["description"])
+            description = get("description")
+            if description:
+                self._add_bullet_point(description)
 
     def _create_references_section(self):
         """Creates the references section."""
@@ -571,18 +813,14 @@ class DocxGenerator:
         self._add_section_header("REFERENCES")
         
         if len(references) == 0:
-            ref_para = self.doc.add_paragraph()
-            self._set_paragraph_spacing(ref_para)
-            ref_run = ref_para.add_run("References available upon request.")
-            self._set_font_properties(ref_run)
+            ref_para = self._add_spaced_paragraph()
+            self._add_run(ref_para, "References available upon request.")
         else:
             # If references are explicitly provided, show them
             for ref in references:
                 if ref.get("name"):
-                    ref_para = self.doc.add_paragraph()
-                    self._set_paragraph_spacing(ref_para)
-                    ref_run = ref_para.add_run(ref["name"])
-                    self._set_font_properties(ref_run, bold=True)
+                    ref_para = self._add_spaced_paragraph()
+                    self._add_run(ref_para, ref["name"], bold=True)
                     
                     # Add relationship and company on same line
                     ref_details = []
@@ -591,9 +829,7 @@ class DocxGenerator:
                     if ref.get("company"):
                         ref_details.append(ref["company"])
                     if ref_details:
-                        ref_para.add_run(f", {', '.join(ref_details)}")
-                        for run in ref_para.runs[-1:]:
-                            self._set_font_properties(run)
+                        self._add_run(ref_para, f", {', '.join(ref_details)}")
                 
                 # Contact info on next line
                 contact_parts = []
@@ -602,56 +838,91 @@ class DocxGenerator:
                 if ref.get("phone"):
                     contact_parts.append(ref["phone"])
                 if contact_parts:
-                    contact_para = self.doc.add_paragraph()
-                    self._set_paragraph_spacing(contact_para, after=3)
-                    contact_run = contact_para.add_run(" | ".join(contact_parts))
-                    self._set_font_properties(contact_run)
+                    contact_para = self._add_spaced_paragraph(after=3)
+                    self._add_run(contact_para, " | ".join(contact_parts))
+
+    def _add_paragraph(self):
+        """Appends an empty paragraph to the end of the document body.
+
+        New paragraphs are inserted directly before the cached ``w:sectPr``;
+        ``Document.add_paragraph`` rescans the body for it on every call.
+        Styling goes through `_add_spaced_paragraph`, which owns the ``w:pPr``.
+        """
+        p = OxmlElement('w:p')
+        if self._sect_pr is not None:
+            self._sect_pr.addprevious(p)
+        else:
+            self._body.append(p)
+        return Paragraph(p, self.doc)
+
+    def _add_spaced_paragraph(self, before=None, after=None, line_spacing=None, style_id=None, center=False):
+        """Appends a paragraph with its spacing (and optional style/centering) already set.
+
+        The whole ``w:pPr`` is copied from a prebuilt template in one append;
+        setting each property through python-docx looks up the child insertion
+        point by XPath on every call.
+        """
+        paragraph = self._add_paragraph()
+        paragraph._p.insert(0, deepcopy(_ppr_template(
+            style_id,
+            self._space_before if before is None else _twips(before),
+            self._space_after if after is None else _twips(after),
+            self._line_spacing if line_spacing is None else _line_twips(line_spacing),
+            center,
+        )))
+        return paragraph
+
+    def _start_line(self, paragraph):
+        """Starts a new line in `paragraph`, creating the paragraph if it is None.
+
+        Lines after the first are separated by a ``w:br`` break rather than
+        emitted as separate paragraphs.
+        """
+        if paragraph is None:
+            paragraph = self._add_spaced_paragraph()
+        else:
+            paragraph._p.add_r().add_br()
+        return paragraph
 
     def _add_section_header(self, text):
-        header = self.doc.add_paragraph()
-        self._set_paragraph_spacing(header, before=3, after=2)
-        run = header.add_run(text)
-        self._set_font_properties(run, bold=True)
+        header = self._add_spaced_paragraph(before=3, after=2)
+        self._add_run(header, text, bold=True)
 
     def _add_bullet_point(self, text):
-        bullet_para = self.doc.add_paragraph(style='CustomBulletStyle')
-        self._set_paragraph_spacing(bullet_para, after=3)
-        run = bullet_para.add_run(text)
-        self._set_font_properties(run)
+        bullet_para = self._add_spaced_paragraph(after=3, style_id=self._bullet_style_id)
+        self._add_run(bullet_para, text)
+
+    def _add_run(self, paragraph, text, bold=False):
+        """Appends a ``w:r`` holding `text` to `paragraph` in the shared body or bold style.
 
-    def _set_font_properties(self, run, bold=False):
-        run.font.name = self.style["font_name"]
-        run.font.size = Pt(self.style["font_size"])
-        run.font.bold = bold
+        The run is built directly on the paragraph element; ``Paragraph.add_run``
+        wraps each run in a proxy and writes its text through the run API.
+        """
+        r = paragraph._p.add_r()
+        r.append(deepcopy(self._run_rprs[bold]))
+        r.text = text
+        return r
 
     def _set_paragraph_spacing(self, paragraph, before=None, after=None, line_spacing=None):
-        p_spacing = self.style["paragraph_spacing"]
-        paragraph.paragraph_format.space_before = Pt(before if before is not None else p_spacing["before"])
-        paragraph.paragraph_format.space_after = Pt(after if after is not None else p_spacing["after"])
-        paragraph.paragraph_format.line_spacing = line_spacing if line_spacing is not None else p_spacing["line_spacing"]
+        """Writes before/after (points) and line spacing (multiple) in one ``w:spacing`` update."""
+        spacing = paragraph._p.get_or_add_pPr().get_or_add_spacing()
+        spacing.set(_QN['w:before'], self._space_before if before is None else _twips(before))
+        spacing.set(_QN['w:after'], self._space_after if after is None else _twips(after))
+        spacing.set(_QN['w:line'], self._line_spacing if line_spacing is None else _line_twips(line_spacing))
+        spacing.set(_QN['w:lineRule'], 'auto')
 
     def _add_hyperlink(self, paragraph, url, text, underline=True):
-        part = paragraph.part
-        r_id = part.relate_to(url, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True)
-        hyperlink = OxmlElement('w:hyperlink')
-        hyperlink.set(qn('r:id'), r_id)
-        new_run = OxmlElement('w:r')
-        
-        if underline:
-            rPr = OxmlElement('w:rPr')
-            u = OxmlElement('w:u')
-            u.set(qn('w:val'), 'single')
-            rPr.append(u)
-            new_run.append(rPr)
-
-        t = OxmlElement('w:t')
-        t.text = text
-        new_run.append(t)
-        hyperlink.append(new_run)
+        r_id = self._link_rids.get(url)
+        if r_id is None:
+            r_id = self._link_rids[url] = self.doc.part.relate_to(url, _HYPERLINK_REL, is_external=True)
+        hyperlink = deepcopy(self._link_templates[underline])
+        hyperlink.set(_QN['r:id'], r_id)
+        hyperlink[0][-1].text = text  # w:hyperlink/w:r/w:t
         paragraph._p.append(hyperlink)
         return hyperlink
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _format_date(date_str):
         """Formats date strings to human-readable format.
         
@@ -663,14 +934,25 @@ class DocxGenerator:
         if not date_str:
             return ""
         
-        # Try different date formats
-        date_formats = [
-            ("%Y-%m-%d", "%B %d, %Y"),  # Full date
-            ("%Y-%m", "%B %Y"),          # Year and month
-            ("%Y", "%Y")                 # Year only
-        ]
+        # Fast path for zero-padded YYYY-MM[-DD] forms, skipping strptime/strftime
+        match = _ISO_DATE_RE.match(date_str)
+        if match:
+            year, month, day = match.groups()
+            if day is None:
+                if 1 <= int(month) <= 12:
+                    return f"{_MONTH_NAMES[int(month) - 1]} {year}"
+            else:
+                try:
+                    datetime(int(year), int(month), int(day))
+                except ValueError:
+                    pass  # e.g. 2025-02-30; left to the strptime fallback
+                else:
+                    return f"{_MONTH_NAMES[int(month) - 1]} {day}, {year}"
+        # A bare four-digit year formats to itself
+        elif len(date_str) == 4 and date_str.isdecimal() and date_str[0] != "0":
+            return date_str
         
-        for input_fmt, output_fmt in date_formats:
+        for input_fmt, output_fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, input_fmt).strftime(output_fmt)
             except ValueError:
@@ -680,36 +962,40 @@ class DocxGenerator:
         return date_str
 
     @staticmethod
+    def _split_url(url):
+        # Scheme-less URLs ("example.com/me") would otherwise parse as a bare path
+        return urlsplit(url if "//" in url else f"//{url}")
+
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _extract_domain(url):
         if not url:
             return ""
-        return url.replace("https://", "").replace("http://", "").split("/")[0]
+        try:
+            return DocxGenerator._split_url(url).hostname or url
+        except ValueError:
+            return url  # e.g. an unclosed IPv6 bracket; shown as written
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _format_url(url):
         if not url:
             return ""
         
-        domain = DocxGenerator._extract_domain(url)
-        if "linkedin.com/in/" in url:
-            try:
-                username = url.split("/in/")[1].split("/")[0]
-                return f"linkedin.com/in/{username}"
-            except IndexError:
-                return domain
-        if "github.com/" in url:
-            try:
-                username = url.split("github.com/")[1].split("/")[0]
-                return f"github.com/{username}"
-            except IndexError:
-                return domain
-        return domain
+        match = _LINKEDIN_RE.search(url)
+        if match:
+            return f"linkedin.com/in/{match.group(1)}"
+        match = _GITHUB_RE.search(url)
+        if match:
+            return f"github.com/{match.group(1)}"
+        return DocxGenerator._extract_domain(url)
 
     @staticmethod
     def _find_company_url(job_data):
-        for field in ["companyUrl", "company_url", "website", "url", "link", "homepage"]:
-            if job_data.get(field):
-                return job_data[field]
+        for field in _COMPANY_URL_FIELDS:
+            value = job_data.get(field)
+            if value:
+                return value
         return None
 
     @staticmethod
@@ -717,11 +1003,12 @@ class DocxGenerator:
         name = language.get("language")
         if not name:
             return ""
-        if language.get("native") or language.get("proficiency") == "C2":
-            return f"{name} (native)"
-        if language.get("proficiency"):
-            return f"{name} ({language.get('proficiency')})"
-        return name
+        proficiency = language.get("proficiency")
+        if not proficiency and not language.get("native"):
+            return name
+        if proficiency == "C2" or language.get("native"):
+            return name + " (native)"
+        return f"{name} ({proficiency})"
 
 def main():
     """Backwards compatibility wrapper - redirects to new CLI."""
@@ -735,18 +1022,8 @@ def main():
         print("  cvac generate <input> <output>")
         sys.exit(1)
     
-    # Prepare arguments for new CLI
-    new_args = ['cvac', 'generate']
-    new_args.extend(sys.argv[1:])
-    
-    # Replace sys.argv temporarily
-    old_argv = sys.argv
-    sys.argv = new_args
-    
-    try:
-        return cvac_main()
-    finally:
-        sys.argv = old_argv
+    # Pass the old-style arguments straight to the generate command
+    return cvac_main(['generate', *sys.argv[1:]])
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,9 @@
+"""
+Shared pytest configuration.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
@@ -7,12 +7,8 @@ import json
 import yaml
 import tempfile
 import os
-import sys
 import subprocess
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from cvac.core.data_handler import DataHandler
 
 
@@ -168,3 +164,29 @@ def test_pretty_print_json():
         
     finally:
         os.unlink(pretty_file)
+
+
+def test_convert_validation_is_optional():
+    """Test that convert only validates when asked to."""
+    handler = DataHandler()
+    
+    incomplete_data = {"personalInfo": {"firstName": "Draft"}}
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump(incomplete_data, f)
+        yaml_file = f.name
+    
+    json_file = yaml_file.replace('.yaml', '.json')
+    
+    try:
+        with pytest.raises(Exception):
+            handler.convert(yaml_file, json_file)
+        
+        assert handler.convert(yaml_file, json_file, validate=False) == 'json'
+        with open(json_file, 'r') as f:
+            assert json.load(f) == incomplete_data
+        
+    finally:
+        for path in [yaml_file, json_file]:
+            if os.path.exists(path):
+                os.unlink(path)
@@ -3,17 +3,15 @@ Tests for data_handler module.
 """
 
 import pytest
+import io
 import json
 import yaml
+import jsonschema
 import tempfile
 import os
 from pathlib import Path
-import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from cvac.core.data_handler import DataHandler
+from cvac.core.data_handler import DataHandler, get_validator, _json_dumps
 
 
 @pytest.fixture
@@ -75,6 +73,51 @@ def test_detect_format_by_extension():
     assert handler.detect_format("test.YAML") == "yaml"
 
 
+@pytest.mark.parametrize("content, expected", [
+    ('{"a": 1}', "json"),
+    ('\n  [1, 2]', "json"),
+    ("{a: 1}", "yaml"),
+    ("a: 1\n", "yaml"),
+    ("# CV\n---\nname: Jane\n", "yaml"),
+    ("'a b': 1\n", "yaml"),
+])
+def test_detect_format_by_content(tmp_path, content, expected):
+    """Test format detection for files without a known extension."""
+    data_file = tmp_path / "cv.txt"
+    data_file.write_text(content)
+    
+    assert DataHandler().detect_format(str(data_file)) == expected
+
+
+def test_detect_format_skips_byte_order_mark(tmp_path):
+    """Test that a UTF-8 byte order mark before JSON content is skipped."""
+    data_file = tmp_path / "cv.txt"
+    data_file.write_bytes(b'\xef\xbb\xbf  {"a": 1}')
+    
+    assert DataHandler().detect_format(str(data_file)) == "json"
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b"\n\n",
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\xff\xfe",
+    b"just some text\n",
+    b"# only a comment\n",
+    b"- a\n- b\n",
+    b"\xbf\xef{\"a\": 1}",
+])
+def test_detect_format_rejects_non_mappings(tmp_path, content):
+    """Test that content neither JSON nor a YAML mapping is not labelled YAML."""
+    data_file = tmp_path / "cv.txt"
+    data_file.write_bytes(content)
+    handler = DataHandler()
+    
+    with pytest.raises(ValueError, match="Cannot determine format"):
+        handler.detect_format(str(data_file))
+    with pytest.raises(ValueError, match="Cannot determine format"):
+        handler.load_data(str(data_file))
+
+
 def test_load_json_data(temp_files):
     """Test loading JSON data."""
     json_file, _ = temp_files
@@ -118,6 +161,33 @@ def test_validate_invalid_data():
         handler.validate_data(invalid_data)
 
 
+def test_validation_error_reports_path(sample_cv_data):
+    """Test that validation errors carry the path to the offending value."""
+    handler = DataHandler()
+    sample_cv_data["personalInfo"]["firstName"] = 42
+    
+    with pytest.raises(jsonschema.ValidationError) as exc_info:
+        handler.validate_data(sample_cv_data)
+    assert list(exc_info.value.absolute_path) == ["personalInfo", "firstName"]
+
+
+@pytest.mark.parametrize("field, value, message", [
+    ("firstName", 42, "42 is not of type 'string'"),
+    ("firstName", None, "'firstName' is a required property"),
+])
+def test_validation_error_message_matches_jsonschema(sample_cv_data, field, value, message):
+    """Test that error messages read the same whichever validator backend is installed."""
+    handler = DataHandler()
+    if value is None:
+        del sample_cv_data["personalInfo"][field]
+    else:
+        sample_cv_data["personalInfo"][field] = value
+    
+    with pytest.raises(jsonschema.ValidationError) as exc_info:
+        handler.validate_data(sample_cv_data)
+    assert exc_info.value.message == message
+
+
 def test_save_data_json(sample_cv_data):
     """Test saving data as JSON."""
     handler = DataHandler()
@@ -137,6 +207,22 @@ def test_save_data_json(sample_cv_data):
         os.unlink(output_file)
 
 
+@pytest.mark.parametrize("format_type", ["json", "yaml"])
+def test_save_and_load_file_objects(sample_cv_data, format_type):
+    """Test round-tripping data through in-memory file objects."""
+    handler = DataHandler()
+    
+    buffer = io.BytesIO()
+    handler.save_data(sample_cv_data, buffer, format_type=format_type)
+    
+    # The format is sniffed from the content when not given
+    buffer.seek(0)
+    assert handler.load_data(buffer) == sample_cv_data
+    
+    with pytest.raises(ValueError):
+        handler.save_data(sample_cv_data, io.BytesIO())
+
+
 def test_save_data_yaml(sample_cv_data):
     """Test saving data as YAML."""
     handler = DataHandler()
@@ -162,3 +248,103 @@ def test_file_not_found():
     
     with pytest.raises(FileNotFoundError):
         handler.load_data("non_existent_file.json")
+
+
+def test_validator_is_cached_per_schema_file(tmp_path):
+    """Test that compiled validators are reused until the schema changes."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "object"}))
+    
+    validator = get_validator(schema_file)
+    assert get_validator(schema_file) is validator
+    
+    # Bump the mtime explicitly; rewrites can land within the same timestamp
+    mtime_ns = os.stat(schema_file).st_mtime_ns
+    schema_file.write_text(json.dumps({"type": "array"}))
+    os.utime(schema_file, ns=(mtime_ns, mtime_ns + 1))
+    assert get_validator(schema_file) is not validator
+
+
+def test_default_schema_is_shared():
+    """Test that DataHandler instances share the parsed default schema."""
+    assert DataHandler().schema is DataHandler().schema
+
+
+def test_fast_load_and_validate(temp_files, tmp_path):
+    """Test the pass/fail-only validation path."""
+    json_file, _ = temp_files
+    handler = DataHandler()
+    
+    assert handler.load_and_validate(json_file, fast=True) == handler.load_data(json_file)
+    
+    invalid_file = tmp_path / "invalid.json"
+    invalid_file.write_text(json.dumps({"personalInfo": {}}))
+    assert not handler.is_valid(handler.load_data(str(invalid_file)))
+    with pytest.raises(ValueError):
+        handler.load_and_validate(str(invalid_file), fast=True)
+
+
+def test_validate_many(temp_files, tmp_path):
+    """Test validating several files in one pass."""
+    json_file, yaml_file = temp_files
+    invalid_file = tmp_path / "invalid.json"
+    invalid_file.write_text(json.dumps({"personalInfo": {}}))
+    missing_file = str(tmp_path / "missing.json")
+    
+    results = list(DataHandler().validate_many([json_file, yaml_file, str(invalid_file), missing_file]))
+    
+    assert [ok for _, ok, _ in results] == [True, True, False, False]
+    assert results[0][2] is None
+    assert isinstance(results[2][2], jsonschema.ValidationError)
+    assert isinstance(results[3][2], FileNotFoundError)
+
+
+def test_validate_many_reports_unreadable_paths(temp_files, tmp_path):
+    """Test that a path that cannot be read is reported without stopping the loop."""
+    json_file, _ = temp_files
+    directory = tmp_path / "not-a-file.json"
+    directory.mkdir()
+    
+    results = list(DataHandler().validate_many([str(directory), json_file]))
+    
+    assert [ok for _, ok, _ in results] == [False, True]
+    assert isinstance(results[0][2], OSError)
+
+
+def test_validate_many_defers_to_full_validation(temp_files):
+    """Test that a file the quick check rejects but validate() accepts is reported valid."""
+    json_file, _ = temp_files
+    
+    class DisagreeingValidator:
+        def is_valid(self, instance):
+            return False
+        
+        def validate(self, instance):
+            pass
+    
+    handler = DataHandler()
+    handler._validator = DisagreeingValidator()
+    
+    assert list(handler.validate_many([json_file])) == [(json_file, True, None)]
+
+
+def test_pretty_json_matches_stdlib_layout(sample_cv_data):
+    """Test that pretty JSON output keeps the stdlib indent=2 layout."""
+    data = dict(sample_cv_data, summary="Développeur — 日本語", tags=[], extra={})
+    
+    expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    assert _json_dumps(data, pretty=True) == expected
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_output_matches_across_backends(monkeypatch, sample_cv_data, pretty):
+    """Test that orjson and the stdlib fallback serialize the same data."""
+    from cvac.core import data_handler
+    if not data_handler.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    data = dict(sample_cv_data, summary="Développeur — 日本語", tags=[], extra={})
+    
+    fast = _json_dumps(data, pretty=pretty)
+    monkeypatch.setattr(data_handler, "ORJSON_AVAILABLE", False)
+    assert json.loads(_json_dumps(data, pretty=pretty)) == json.loads(fast) == data
+
@@ -1,10 +1,5 @@
 import pytest
 import json
-import os
-import sys
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from cvac.cv_to_docx import CVData
 
@@ -85,3 +80,8 @@ def test_missing_json_file_raises_error(tmp_path):
     schema_file.write_text("{}")
     with pytest.raises(SystemExit):
         CVData("non_existent.json", str(schema_file))
+
+def test_from_validated_dict_skips_loading(valid_cv_data):
+    cv_data = CVData.from_validated_dict(valid_cv_data)
+    assert cv_data.data is valid_cv_data
+    assert cv_data.json_path is None
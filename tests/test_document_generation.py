@@ -1,12 +1,12 @@
 import pytest
+import collections
+import io
 import os
 import json
-import sys
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import zipfile
 
 from docx import Document
+from cvac import cv_to_docx
 from cvac.cv_to_docx import CVData, DocxGenerator
 from cvac.core.style_loader import StyleLoader
 
@@ -63,3 +63,120 @@ def test_document_generation(cv_data_instance, tmp_path):
     # Check for the name in the document
     name_found = any("Test User" in p.text for p in doc.paragraphs)
     assert name_found, "Name 'Test User' not found in the generated document."
+
+def test_document_generation_uncompressed(cv_data_instance, tmp_path):
+    output_path = tmp_path / "test_cv.docx"
+    style_config = StyleLoader().load_style()
+    generator = DocxGenerator(cv_data_instance, style_config)
+    generator.generate(str(output_path), compress=False)
+
+    with zipfile.ZipFile(output_path) as archive:
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in archive.infolist())
+
+    doc = Document(output_path)
+    assert any("Test User" in p.text for p in doc.paragraphs)
+
+def test_document_generation_compressed_by_default(cv_data_instance):
+    style_config = StyleLoader().load_style()
+    content = DocxGenerator(cv_data_instance, style_config).generate_bytes()
+
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert all(info.compress_type == zipfile.ZIP_DEFLATED for info in archive.infolist())
+
+def test_uncompressed_falls_back_without_package_writer_helpers(cv_data_instance, monkeypatch):
+    monkeypatch.setattr(cv_to_docx, "_PACKAGE_WRITER_AVAILABLE", False)
+    style_config = StyleLoader().load_style()
+    content = DocxGenerator(cv_data_instance, style_config).generate_bytes(compress=False)
+
+    doc = Document(io.BytesIO(content))
+    assert any("Test User" in p.text for p in doc.paragraphs)
+
+def test_generate_bytes(cv_data_instance):
+    style_config = StyleLoader().load_style()
+    content = DocxGenerator(cv_data_instance, style_config).generate_bytes()
+
+    doc = Document(io.BytesIO(content))
+    assert any("Test User" in p.text for p in doc.paragraphs)
+
+def test_generate_to_file_object(cv_data_instance):
+    style_config = StyleLoader().load_style()
+    buffer = io.BytesIO()
+    DocxGenerator(cv_data_instance, style_config).generate(buffer)
+
+    buffer.seek(0)
+    doc = Document(buffer)
+    assert any("Test User" in p.text for p in doc.paragraphs)
+
+def test_generate_with_malformed_url(cv_data_instance):
+    cv_data_instance.data["personalInfo"]["website"] = "http://[abc"
+    style_config = StyleLoader().load_style()
+    content = DocxGenerator(cv_data_instance, style_config).generate_bytes()
+
+    doc = Document(io.BytesIO(content))
+    assert any("http://[abc" in p.text for p in doc.paragraphs)
+
+def test_document_generation_reuses_styled_template(cv_data_instance, tmp_path):
+    style_config = StyleLoader().load_style()
+    archives = []
+    for name in ("first.docx", "second.docx"):
+        output_path = tmp_path / name
+        DocxGenerator(cv_data_instance, style_config).generate(str(output_path))
+        with zipfile.ZipFile(output_path) as archive:
+            archives.append({member: archive.read(member) for member in archive.namelist()})
+
+    # The second document is built from the cached template snapshot
+    assert archives[0] == archives[1]
+
+def test_styled_template_cache_is_bounded(cv_data_instance, monkeypatch):
+    monkeypatch.setattr(DocxGenerator, "_TEMPLATES", collections.OrderedDict())
+    base_style = StyleLoader().load_style()
+    for font_size in range(8, 8 + DocxGenerator.MAX_TEMPLATES + 2):
+        DocxGenerator(cv_data_instance, dict(base_style, font_size=font_size))
+
+    assert len(DocxGenerator._TEMPLATES) == DocxGenerator.MAX_TEMPLATES
+    newest = json.dumps(dict(base_style, font_size=font_size), sort_keys=True)
+    assert newest in DocxGenerator._TEMPLATES
+
+@pytest.mark.parametrize("date_str, expected", [
+    ("2025-01-15", "January 15, 2025"),
+    ("2020-03", "March 2020"),
+    ("2019", "2019"),
+    ("2020-13", "2020-13"),
+    ("2025-02-30", "2025-02-30"),
+    ("2024-02-29", "February 29, 2024"),
+    ("2025-1-5", "January 05, 2025"),
+    ("", ""),
+    (None, ""),
+])
+def test_format_date(date_str, expected):
+    assert DocxGenerator._format_date(date_str) == expected
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://example.com/about", "example.com"),
+    ("HTTP://Example.com", "example.com"),
+    ("example.com/about", "example.com"),
+    ("http://[abc", "http://[abc"),
+    ("", ""),
+])
+def test_extract_domain(url, expected):
+    assert DocxGenerator._extract_domain(url) == expected
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/in/jdoe/", "linkedin.com/in/jdoe"),
+    ("https://github.com/jdoe/project", "github.com/jdoe"),
+    ("https://github.com/", "github.com"),
+    ("https://jdoe.dev/blog", "jdoe.dev"),
+    ("http://[abc", "http://[abc"),
+])
+def test_format_url(url, expected):
+    assert DocxGenerator._format_url(url) == expected
+
+@pytest.mark.parametrize("language, expected", [
+    ({"language": "English", "native": True}, "English (native)"),
+    ({"language": "German", "proficiency": "C2"}, "German (native)"),
+    ({"language": "Spanish", "proficiency": "B2"}, "Spanish (B2)"),
+    ({"language": "French"}, "French"),
+    ({"proficiency": "A1"}, ""),
+])
+def test_format_language_entry(language, expected):
+    assert DocxGenerator._format_language_entry(language) == expected
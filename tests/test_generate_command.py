@@ -0,0 +1,46 @@
+"""
+Tests for the generate command.
+"""
+
+import pytest
+import json
+import argparse
+
+from cvac.__main__ import main
+from cvac.commands.generate import generate_command
+
+
+def test_batch_rejects_inputs_sharing_an_output(tmp_path, capsys):
+    """Test that same-stem files in a directory do not overwrite each other."""
+    (tmp_path / "cv.json").write_text(json.dumps({"personalInfo": {}}))
+    (tmp_path / "cv.yaml").write_text("personalInfo: {}\n")
+    output_dir = tmp_path / "out"
+    
+    args = argparse.Namespace(input=str(tmp_path), output=str(output_dir),
+                              style=None, fast=False, jobs=1)
+    assert generate_command(args) == 1
+    assert "would both be written to" in capsys.readouterr().out
+    assert not output_dir.exists()
+
+
+def test_glob_rejects_matches_sharing_a_stem(tmp_path, capsys):
+    """Test that glob matches from different directories do not overwrite each other."""
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "cv.json").write_text(json.dumps({"personalInfo": {}}))
+    output_dir = tmp_path / "out"
+    
+    args = argparse.Namespace(input=str(tmp_path / "*" / "cv.json"), output=str(output_dir),
+                              style=None, fast=False, jobs=1)
+    assert generate_command(args) == 1
+    assert "would both be written to" in capsys.readouterr().out
+    assert not output_dir.exists()
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2", "many"])
+def test_jobs_must_be_positive(jobs, capsys):
+    """Test that invalid --jobs values are rejected by the argument parser."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["generate", "cvs/", "--jobs", jobs])
+    assert exc_info.value.code == 2
+    assert "--jobs" in capsys.readouterr().err
@@ -3,15 +3,14 @@ Tests for style_loader module.
 """
 
 import pytest
+import collections
 import json
 import yaml
 import tempfile
 import os
+import subprocess
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from cvac.core.style_loader import StyleLoader
 from cvac.style import STYLE_CONFIG as DEFAULT_STYLE
 
@@ -66,6 +65,54 @@ def test_load_json_style(custom_style):
         os.unlink(style_file)
 
 
+def test_load_style_reloads_changed_file(custom_style):
+    """Test that a cached style file is reused until it changes on disk."""
+    loader = StyleLoader()
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        json.dump(custom_style, f)
+        style_file = f.name
+    
+    try:
+        first = loader.load_style(style_file)
+        first["margins"]["top"] = None
+        
+        # Callers get their own copy of the cached style
+        second = loader.load_style(style_file)
+        assert second["margins"]["top"] is not None
+        
+        custom_style["font_name"] = "Arial"
+        with open(style_file, 'w') as f:
+            json.dump(custom_style, f)
+        stat = os.stat(style_file)
+        os.utime(style_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert loader.load_style(style_file)["font_name"] == "Arial"
+        
+    finally:
+        os.unlink(style_file)
+
+
+def test_style_cache_keys_on_resolved_path_and_is_bounded(custom_style, tmp_path, monkeypatch):
+    """Test that spellings of one path share a cache entry and old entries are evicted."""
+    monkeypatch.setattr(StyleLoader, "_STYLE_CACHE", collections.OrderedDict())
+    monkeypatch.chdir(tmp_path)
+    loader = StyleLoader()
+    (tmp_path / "style.json").write_text(json.dumps(custom_style))
+    
+    loader.load_style("style.json")
+    loader.load_style(os.path.join(".", "style.json"))
+    loader.load_style(str(tmp_path / "style.json"))
+    assert len(StyleLoader._STYLE_CACHE) == 1
+    
+    for i in range(StyleLoader.MAX_CACHED_STYLES + 2):
+        style_file = tmp_path / f"style{i}.json"
+        style_file.write_text(json.dumps(custom_style))
+        loader.load_style(str(style_file))
+    assert len(StyleLoader._STYLE_CACHE) == StyleLoader.MAX_CACHED_STYLES
+    assert str(style_file.resolve()) in {key[0] for key in StyleLoader._STYLE_CACHE}
+
+
 def test_load_yaml_style(custom_style):
     """Test loading style from YAML file."""
     loader = StyleLoader()
@@ -146,6 +193,21 @@ def test_unit_conversion():
     assert hasattr(merged["bullet_style"]["space_after"], "pt")
 
 
+def test_import_does_not_load_docx():
+    """Test that python-docx is only imported once units are converted."""
+    src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+    code = (
+        "import sys\n"
+        "from cvac.core.style_loader import StyleLoader\n"
+        "StyleLoader().validate_style({'font_size': 12})\n"
+        "print('docx' in sys.modules)\n"
+    )
+    # Run from src/ so the package, not the repo's cvac.py script, is imported
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=src_dir, check=True)
+    assert result.stdout.strip() == "False"
+
+
 def test_file_not_found():
     """Test handling of non-existent style file."""
     loader = StyleLoader()